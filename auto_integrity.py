@@ -15,11 +15,88 @@ Usage:
         sys.exit(1)
 """
 
+import functools
+import json
+import logging
 import os
 import sys
-from typing import Optional, Tuple
-from generate_integrity_manifest import IntegrityManifestGenerator
-from integrity_checker import RuntimeIntegrityChecker
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, TextIO, Tuple
+
+# The manifest generator, checker and thread pool are imported lazily in the
+# methods that need them, so a run that hits the verification fast path never
+# loads them.
+if TYPE_CHECKING:
+    from integrity_checker import RuntimeIntegrityChecker
+
+# Directory containing the tools (and their manifest) - resolved once per process
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Receives one structured record per run(); routine outcomes go only here
+logger = logging.getLogger(__name__)
+
+_RULE = "=" * 70
+
+# Multi-line messages, each written with a single write() call
+_TAMPER_ALERT_TEMPLATE = f"""
+{_RULE}
+⚠️  SECURITY ALERT: CODE TAMPERING DETECTED!
+{_RULE}
+Details: {{message}}
+
+The FAIR Risk Calculator has been modified since the baseline
+was established. This could indicate:
+  • Malicious tampering by an adversary
+  • Accidental modification
+  • Legitimate update without regenerating baseline
+
+Recommended actions:
+  1. If you made legitimate changes:
+     python generate_integrity_manifest.py
+  2. If you did NOT make changes:
+     Restore from backup and investigate
+  3. For more details:
+     python verify_integrity.py --verbose
+{_RULE}
+
+"""
+
+_SELF_TEST_SUCCESS = """✅ SUCCESS: Auto-integrity system working correctly
+
+The system will:
+  • Auto-generate baseline on first run
+  • Auto-verify on subsequent runs
+  • Alert on tampering detection
+"""
+
+
+def _write(text: str, stream: Optional[TextIO] = None) -> None:
+    """Write a block of text in one call and flush it (default: stdout)"""
+    stream = stream or sys.stdout
+    stream.write(text)
+    stream.flush()
+
+
+def _log_result(status: str, files_count: Optional[int], elapsed_ms: float,
+                algorithm: Optional[str]) -> None:
+    """
+    Emit the outcome of an integrity run as a single JSON log record
+
+    Args:
+        status: 'pass', 'tampered', 'generated', 'generate_failed' or 'no_baseline'
+        files_count: Number of monitored files (None if unknown)
+        elapsed_ms: Wall time of the run in milliseconds
+        algorithm: Hash algorithm of the manifest (None if unknown)
+    """
+    record = {'event': f'integrity.{status}', 'status': status, 'files_count': files_count,
+              'elapsed_ms': round(elapsed_ms, 3), 'algorithm': algorithm}
+    logger.info(json.dumps(record), extra={'integrity': record})
+
+
+@functools.lru_cache(maxsize=8)
+def _manifest_exists(manifest_path: str) -> bool:
+    """Memoized existence check - cleared whenever a manifest is written"""
+    return os.path.exists(manifest_path)
 
 
 class AutoIntegrity:
@@ -29,7 +106,11 @@ class AutoIntegrity:
                  manifest_name: str = 'integrity_manifest.json',
                  auto_generate: bool = True,
                  strict: bool = False,
-                 silent: bool = False):
+                 silent: bool = False,
+                 cache_name: str = '.integrity_cache.json',
+                 max_workers: Optional[int] = None,
+                 algorithm: Optional[str] = None,
+                 base_dir: str = _BASE_DIR):
         """
         Initialize auto-integrity system
 
@@ -37,20 +118,32 @@ class AutoIntegrity:
             manifest_name: Name of the manifest file
             auto_generate: If True, auto-generate on first run
             strict: If True, exit program on verification failure
-            silent: If True, suppress informational messages (warnings still shown)
+            silent: If True, suppress the tamper alert and warnings on stderr
+            cache_name: Name of the verification cache sidecar file
+            max_workers: Number of hashing threads (default: None = auto)
+            algorithm: Hash algorithm for auto-generated baselines
+                       (default: None = BLAKE3 if installed, else SHA-256)
+            base_dir: Directory containing the monitored files
+                      (default: the directory this module lives in)
         """
         self.manifest_name = manifest_name
         self.auto_generate = auto_generate
         self.strict = strict
         self.silent = silent
+        self.max_workers = max_workers
+        self.algorithm = algorithm
 
-        # Determine base directory (where the script is located)
-        self.base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.base_dir = base_dir
         self.manifest_path = os.path.join(self.base_dir, manifest_name)
+        self.cache_path = os.path.join(self.base_dir, cache_name)
+
+        # Monitored file count and algorithm of the last generate/verify, for logging
+        self._files_count = None
+        self._manifest_algorithm = None
 
     def manifest_exists(self) -> bool:
         """Check if integrity manifest exists"""
-        return os.path.exists(self.manifest_path)
+        return _manifest_exists(self.manifest_path)
 
     def generate_manifest(self) -> bool:
         """
@@ -60,53 +153,189 @@ class AutoIntegrity:
             True if generation successful, False otherwise
         """
         try:
-            if not self.silent:
-                print("\n" + "="*70)
-                print("🔒 FIRST RUN DETECTED - Establishing Security Baseline")
-                print("="*70)
-                print("Generating cryptographic integrity baseline...")
-                print("This protects your FAIR Risk Calculator from tampering.")
-
-            # Create generator
-            generator = IntegrityManifestGenerator(base_dir=self.base_dir)
-
-            # Generate manifest (suppress detailed output if silent)
-            if self.silent:
-                # Redirect stdout temporarily
-                import io
-                old_stdout = sys.stdout
-                sys.stdout = io.StringIO()
+            from generate_integrity_manifest import IntegrityManifestGenerator
+            from integrity_checker import BLAKE3_AVAILABLE
+
+            algorithm = self.algorithm
+            if algorithm is None:
+                algorithm = 'BLAKE3' if BLAKE3_AVAILABLE else 'SHA-256'
+
+            generator = IntegrityManifestGenerator(base_dir=self.base_dir,
+                                                   algorithm=algorithm,
+                                                   silent=True)
 
             manifest = generator.generate_manifest(include_additional=True)
             generator.manifest = manifest
             generator.save_manifest(self.manifest_name)
-
-            if self.silent:
-                sys.stdout = old_stdout
-
-            if not self.silent:
-                print("\n✅ Security baseline established successfully!")
-                print(f"   Files monitored: {len(manifest['files'])}")
-                print(f"   Manifest saved: {self.manifest_name}")
-                print("\nYour FAIR Risk Calculator is now protected against tampering.")
-                print("="*70 + "\n")
-
+            _manifest_exists.cache_clear()
+            self._files_count = len(manifest['files'])
+            self._manifest_algorithm = algorithm
             return True
 
         except Exception as e:
             if not self.silent:
-                print(f"\n⚠️  Warning: Failed to generate integrity baseline: {e}")
-                print("Continuing without integrity protection...")
+                print(f"\n⚠️  Warning: Failed to generate integrity baseline: {e}", file=sys.stderr)
+                print("Continuing without integrity protection...", file=sys.stderr)
+            return False
+
+    def _load_cache(self, manifest_mtime_ns: int) -> Dict:
+        """
+        Load the verification cache
+
+        The cache maps each monitored file to the (size, mtime_ns, ctime_ns, hash) it had
+        when it was last verified, and a watermark one timestamp tick before
+        that verification started. It is only valid for the manifest it was written
+        against, so it is discarded whenever the manifest's mtime changes. The
+        cache file's own mtime is added as 'written_mtime_ns', so racy entries
+        can be told apart (see integrity_checker.is_racy()).
+
+        Args:
+            manifest_mtime_ns: Current mtime of the manifest file
+
+        Returns:
+            Cache dictionary, or an empty dict if the cache is missing or stale
+        """
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+                written_ns = os.fstat(f.fileno()).st_mtime_ns
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(cache, dict) or cache.get('manifest_mtime_ns') != manifest_mtime_ns:
+            return {}
+        if not isinstance(cache.get('files'), dict):
+            return {}
+        cache['written_mtime_ns'] = written_ns
+        return cache
+
+    def _save_cache(self, manifest_mtime_ns: int, files: Dict[str, list],
+                    last_verify_mtime_ns: int, algorithm: Optional[str] = None) -> None:
+        """
+        Persist the verification cache (best effort - failures are ignored)
+
+        Args:
+            manifest_mtime_ns: mtime of the manifest the entries were verified against
+            files: Mapping of file path -> [size, mtime_ns, ctime_ns, hash]
+            last_verify_mtime_ns: Verify start time minus STAT_GRANULARITY_NS
+            algorithm: Hash algorithm of the manifest (default: None)
+        """
+        cache = {
+            'manifest_mtime_ns': manifest_mtime_ns,
+            'last_full_verify_mtime_ns': last_verify_mtime_ns,
+            'algorithm': algorithm,
+            'files': files
+        }
+        tmp_path = self.cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def _unchanged_since_last_verify(self, cache: Dict) -> bool:
+        """
+        Coarse fast path: check whether any file changed since the last verify
+
+        Only stats the files recorded in the cache - the manifest is not
+        parsed and nothing is hashed. ctime is checked as well as mtime, so
+        a file replaced with a back-dated mtime is still treated as changed.
+        The watermark is a timestamp tick older than the verify, and a file
+        stamped at it exactly also counts as changed, so an edit made in the
+        same tick as the verify read the file is not missed.
+
+        Args:
+            cache: Cache loaded by _load_cache()
+
+        Returns:
+            True if every cached file is untouched since the last verify
+        """
+        watermark = cache.get('last_full_verify_mtime_ns')
+        files = cache.get('files', {})
+        if not isinstance(watermark, int) or not files:
             return False
 
-    def verify_integrity(self) -> Tuple[bool, str]:
+        for file_path, entry in files.items():
+            try:
+                file_stat = os.stat(os.path.join(self.base_dir, file_path))
+            except OSError:
+                return False
+            if max(file_stat.st_mtime_ns, file_stat.st_ctime_ns) >= watermark:
+                return False
+            if file_stat.st_size != entry[0]:
+                return False
+
+        return True
+
+    def _parallel_verify(self, checker: 'RuntimeIntegrityChecker', files: List[str]) -> bool:
+        """
+        Hash files concurrently and compare them against the manifest
+
+        hashlib releases the GIL while hashing, so threads overlap both disk
+        reads and digest computation. Stops at the first mismatch.
+
+        Args:
+            checker: Checker with its manifest already loaded
+            files: Manifest entries to verify
+
+        Returns:
+            True if every file matches its expected hash, False otherwise
+        """
+        if not files:
+            return True
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        expected = checker.manifest.get('files', {})
+        workers = self.max_workers or min(8, os.cpu_count() or 1)
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(files))) as executor:
+            futures = {executor.submit(checker.calculate_file_hash, file_path): file_path
+                       for file_path in files}
+            for future in as_completed(futures):
+                file_path = futures[future]
+                if future.result() != expected[file_path].get('hash'):
+                    for pending in futures:
+                        pending.cancel()
+                    return False
+
+        return True
+
+    def verify_integrity(self, force: bool = False) -> Tuple[bool, str]:
         """
         Verify integrity against existing manifest
 
+        If no monitored file has been touched since the last successful
+        verify, this returns immediately without parsing the manifest.
+        Otherwise, files whose size, mtime and ctime are unchanged since they were
+        last verified are not re-hashed, unless they were modified within a
+        timestamp tick of the cache being written. Note that this trusts file
+        timestamps; use force=True (or verify_integrity.py) for a full re-hash.
+
+        Args:
+            force: If True, ignore the verification cache and re-hash every file
+
         Returns:
             Tuple of (success, message)
         """
         try:
+            verify_start_ns = time.time_ns()
+            try:
+                manifest_mtime_ns = os.stat(self.manifest_path).st_mtime_ns
+            except OSError:
+                return False, "Failed to load integrity manifest"
+            cache = {} if force else self._load_cache(manifest_mtime_ns)
+
+            # Nothing touched since the last verify - no need to hash anything
+            if cache and self._unchanged_since_last_verify(cache):
+                self._files_count = len(cache['files'])
+                self._manifest_algorithm = cache.get('algorithm')
+                return True, "All files verified successfully"
+
+            from integrity_checker import (RuntimeIntegrityChecker, STAT_GRANULARITY_NS,
+                                           file_stat_key, is_racy)
+
             # Create checker
             checker = RuntimeIntegrityChecker(
                 manifest_path=self.manifest_path,
@@ -118,12 +347,34 @@ class AutoIntegrity:
             if not checker.load_manifest():
                 return False, "Failed to load integrity manifest"
 
-            # Verify all critical files
-            verified = checker.verify_critical_files()
+            # Only files that changed since the last successful verify need hashing
+            cached_files = cache.get('files', {})
+            cache_written_ns = cache.get('written_mtime_ns', 0)
+            fresh_entries = {}
+            suspect_files = []
+            for file_path, file_info in checker.manifest.get('files', {}).items():
+                expected_hash = file_info.get('hash')
+                if not expected_hash:
+                    continue  # Nothing to verify against
+                try:
+                    file_stat = os.stat(os.path.join(self.base_dir, file_path))
+                except OSError:
+                    suspect_files.append(file_path)
+                    continue
+                # Same stat key as the runtime checker's hash cache (ctime included)
+                entry = file_stat_key(file_stat) + [expected_hash]
+                fresh_entries[file_path] = entry
+                if cached_files.get(file_path) != entry or is_racy(entry, cache_written_ns):
+                    suspect_files.append(file_path)
+
+            self._files_count = len(checker.manifest.get('files', {}))
+            self._manifest_algorithm = checker.algorithm
+            verified = self._parallel_verify(checker, suspect_files)
 
             if verified:
-                if not self.silent:
-                    print("🔒 Security Check: ✅ PASSED - Code integrity verified")
+                # Saved even if nothing was re-hashed, to move the watermark forward
+                self._save_cache(manifest_mtime_ns, fresh_entries,
+                                 verify_start_ns - STAT_GRANULARITY_NS, checker.algorithm)
                 return True, "All files verified successfully"
             else:
                 return False, "Code tampering detected"
@@ -131,71 +382,77 @@ class AutoIntegrity:
         except Exception as e:
             return False, f"Verification error: {e}"
 
-    def run(self) -> bool:
+    def run(self, force: bool = False) -> bool:
         """
         Main entry point - handles auto-generation and verification
 
+        Only a tamper alert (or a warning) is printed, on stderr. Every outcome
+        is logged as one JSON record at INFO on this module's logger (status,
+        files_count, elapsed_ms, algorithm), so batch and CI callers can
+        configure logging to see passes and parse the result.
+
+        Args:
+            force: If True, re-hash every file instead of trusting the cache
+
         Returns:
             True if integrity check passed or was generated, False if failed
         """
+        start = time.perf_counter()
+        result, status = self._run(force)
+        _log_result(status, self._files_count, (time.perf_counter() - start) * 1000,
+                    self._manifest_algorithm)
+        return result
+
+    def _run(self, force: bool) -> Tuple[bool, str]:
+        """
+        Generate or verify the baseline and report the outcome
+
+        Args:
+            force: If True, re-hash every file instead of trusting the cache
+
+        Returns:
+            Tuple of (run() result, status name for the log record)
+        """
         # Check if manifest exists
         if not self.manifest_exists():
             # First run - generate manifest
             if self.auto_generate:
                 if not self.generate_manifest():
-                    if not self.strict:
-                        return True  # Continue without protection
-                    else:
-                        return False  # Strict mode - fail if can't generate
-                return True  # Successfully generated
+                    # Strict mode fails if the baseline can't be generated
+                    return not self.strict, 'generate_failed'
+                return True, 'generated'  # Successfully generated
             else:
                 if not self.silent:
-                    print("⚠️  Warning: No integrity baseline found")
-                    print("   Run: python generate_integrity_manifest.py")
-                return True  # Continue without protection
+                    print("⚠️  Warning: No integrity baseline found", file=sys.stderr)
+                    print("   Run: python generate_integrity_manifest.py", file=sys.stderr)
+                return True, 'no_baseline'  # Continue without protection
 
         # Subsequent runs - verify integrity
-        success, message = self.verify_integrity()
+        success, message = self.verify_integrity(force=force)
 
         if not success:
             # Always show alert if not in silent mode
             if not self.silent:
-                print("\n" + "="*70)
-                print("⚠️  SECURITY ALERT: CODE TAMPERING DETECTED!")
-                print("="*70)
-                print(f"Details: {message}")
-                print("\nThe FAIR Risk Calculator has been modified since the baseline")
-                print("was established. This could indicate:")
-                print("  • Malicious tampering by an adversary")
-                print("  • Accidental modification")
-                print("  • Legitimate update without regenerating baseline")
-                print("\nRecommended actions:")
-                print("  1. If you made legitimate changes:")
-                print("     python generate_integrity_manifest.py")
-                print("  2. If you did NOT make changes:")
-                print("     Restore from backup and investigate")
-                print("  3. For more details:")
-                print("     python verify_integrity.py --verbose")
-                print("="*70 + "\n")
+                _write(_TAMPER_ALERT_TEMPLATE.format(message=message), sys.stderr)
 
             if self.strict:
                 if not self.silent:
-                    print("❌ STRICT MODE: Exiting due to integrity failure")
-                return False
+                    print("❌ STRICT MODE: Exiting due to integrity failure", file=sys.stderr)
             else:
                 if not self.silent:
-                    print("⚠️  WARNING MODE: Continuing despite integrity failure")
-                    print("   (Results may not be trustworthy)")
-                # Return False to indicate tampering detected, even in warning mode
-                # The caller can decide whether to continue or not
-                return False
+                    print("⚠️  WARNING MODE: Continuing despite integrity failure", file=sys.stderr)
+                    print("   (Results may not be trustworthy)", file=sys.stderr)
+            # Return False to indicate tampering detected, even in warning mode
+            # The caller can decide whether to continue or not
+            return False, 'tampered'
 
-        return True
+        return True, 'pass'
 
 
 def ensure_integrity(auto_generate: bool = True,
-                    strict: bool = False,
-                    silent: bool = False) -> bool:
+                     strict: bool = False,
+                     silent: bool = False,
+                     max_workers: Optional[int] = None) -> bool:
     """
     Convenience function to ensure code integrity
 
@@ -207,6 +464,7 @@ def ensure_integrity(auto_generate: bool = True,
         auto_generate: Auto-generate manifest on first run (default: True)
         strict: Exit if integrity check fails (default: False)
         silent: Suppress informational messages (default: False)
+        max_workers: Number of hashing threads (default: None = auto)
 
     Returns:
         True if integrity check passed, False if failed
@@ -221,7 +479,8 @@ def ensure_integrity(auto_generate: bool = True,
     auto = AutoIntegrity(
         auto_generate=auto_generate,
         strict=strict,
-        silent=silent
+        silent=silent,
+        max_workers=max_workers
     )
     return auto.run()
 
@@ -276,11 +535,7 @@ if __name__ == '__main__':
     print("="*70)
 
     if result:
-        print("✅ SUCCESS: Auto-integrity system working correctly")
-        print("\nThe system will:")
-        print("  • Auto-generate baseline on first run")
-        print("  • Auto-verify on subsequent runs")
-        print("  • Alert on tampering detection")
+        _write(_SELF_TEST_SUCCESS)
     else:
         print("❌ FAILURE: Auto-integrity check failed")
         print("\nPlease investigate the issue")
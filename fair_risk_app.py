@@ -16,6 +16,13 @@ from datetime import datetime
 from io import BytesIO
 import xlsxwriter
 
+# orjson is optional - much faster JSON export, falls back to the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Auto-integrity protection (optional - auto-generates on first run)
 AUTO_INTEGRITY_AVAILABLE = False
 try:
@@ -760,7 +767,12 @@ def main():
                             'statistics': sim_data['results']['stats']
                         }
                     
-                    json_str = json.dumps(export_data, indent=2, default=str)
+                    if ORJSON_AVAILABLE:
+                        # Serializes NumPy arrays and scalars natively instead of via str()
+                        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                        json_str = orjson.dumps(export_data, default=str, option=options)
+                    else:
+                        json_str = json.dumps(export_data, indent=2, default=str)
                     
                     st.download_button(
                         label="📥 Download JSON Report",
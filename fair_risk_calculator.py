@@ -5,17 +5,54 @@ Based on Factor Analysis of Information Risk (FAIR) methodology
 """
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
+import hashlib
+import importlib.util
 import json
 import argparse
+import functools
+import operator
 import os
-from typing import Dict, List, Tuple, Optional
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
+# matplotlib is imported lazily where figures are drawn, and pandas where
+# tables are built, so simulating and exporting to JSON (and the menu's first
+# prompt) don't pay for them
+if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib.figure import Figure
+
+# xlsxwriter enables streaming (constant-memory) Excel export; it is only
+# imported when a workbook is written
+XLSXWRITER_AVAILABLE = importlib.util.find_spec('xlsxwriter') is not None
+
+# orjson is optional - much faster JSON export, falls back to the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Progress bars are optional - plain per-scenario output is used without tqdm
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+# Numba is optional - fuses the LEF/ALE products into one loop, NumPy otherwise.
+# It is slow to import, so it is only located here and imported on first use.
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# CuPy is optional - runs large batched PERT simulations on a CUDA GPU
+# (backend='cupy'). Like Numba it is only imported when actually used.
+CUPY_AVAILABLE = importlib.util.find_spec('cupy') is not None
+
 # Auto-integrity protection (optional - auto-generates on first run)
 try:
     # Only import if auto_integrity.py exists
@@ -27,32 +64,240 @@ try:
 except ImportError:
     AUTO_INTEGRITY_AVAILABLE = False
 
+# Sample dtypes the fused LEF/ALE loop is compiled for (see sample_dtype)
+_LEF_ALE_SIGNATURES = [
+    'void(f8[::1], f8[::1], f8[::1], f8[::1], f8[::1])',
+    'void(f4[::1], f4[::1], f4[::1], f4[::1], f4[::1])',
+]
+
+
+# add_scenario() parameters per factor (TEF, vulnerability, loss magnitude) and level,
+# read in one call by add_scenarios()
+_SCENARIO_PARAMETERS = operator.itemgetter(
+    'tef_low', 'tef_medium', 'tef_high',
+    'vuln_low', 'vuln_medium', 'vuln_high',
+    'loss_low', 'loss_medium', 'loss_high'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _lef_ale_kernel():
+    """
+    Compile (or load from Numba's on-disk cache) the fused LEF/ALE loop
+
+    The explicit signatures make Numba build every variant when the kernel is
+    first requested rather than on the first call per dtype, so a single
+    warm-up (``fair_risk_calculator.py --warmup``) fills the on-disk cache
+    that later runs load from.
+    """
+    from numba import njit
+
+    @njit(_LEF_ALE_SIGNATURES, cache=True)
+    def kernel(tef, vuln, loss, lef, ale):
+        for i in range(tef.size):
+            lef[i] = tef[i] * vuln[i]
+            ale[i] = lef[i] * loss[i]
+
+    return kernel
+
+
+def _lef_ale(tef: np.ndarray, vuln: np.ndarray, loss: np.ndarray,
+             out: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute LEF = TEF × Vulnerability and ALE = LEF × Loss Magnitude
+
+    With Numba both products are computed in a single pass over the samples;
+    otherwise two NumPy multiplies are used. Results are identical either way.
+
+    Args:
+        tef: TEF samples
+        vuln: Vulnerability samples (same shape as tef)
+        loss: Loss magnitude samples (same shape as tef)
+        out: Optional preallocated, C-contiguous (lef, ale) arrays of the same
+             shape and dtype as the samples to write the results into
+
+    Returns:
+        Tuple of (lef_samples, ale_samples)
+    """
+    if not NUMBA_AVAILABLE:
+        lef_out, ale_out = out if out is not None else (None, None)
+        lef = np.multiply(tef, vuln, out=lef_out)
+        return lef, np.multiply(lef, loss, out=ale_out)
+
+    dtype = np.result_type(tef, vuln, loss)
+    tef, vuln, loss = (np.ascontiguousarray(a, dtype=dtype) for a in (tef, vuln, loss))
+    lef, ale = out if out is not None else (np.empty_like(tef), np.empty_like(tef))
+    _lef_ale_kernel()(tef.reshape(-1), vuln.reshape(-1), loss.reshape(-1),
+                      lef.reshape(-1), ale.reshape(-1))
+    return lef, ale
+
+
+@functools.lru_cache(maxsize=32)
+def _percentile_indices(n: int, levels: Tuple[float, ...]) -> Tuple[np.ndarray, ...]:
+    """
+    Order statistics that np.percentile's linear method interpolates between
+
+    Cached, as every simulation of one calculator uses the same sample
+    count and levels.
+
+    Args:
+        n: Number of samples
+        levels: Percentile levels (0-100)
+
+    Returns:
+        Tuple of (lower indices, upper indices, interpolation weights,
+        sorted unique indices to partition around), all read-only
+    """
+    virtual = (n - 1) * (np.asarray(levels, dtype=float) / 100)
+    lower = np.floor(virtual).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    gamma = virtual - lower
+    kth = np.union1d(lower, upper)
+    for array in (lower, upper, gamma, kth):
+        array.flags.writeable = False
+    return lower, upper, gamma, kth
+
+
+def _partition_statistics(samples: np.ndarray, levels: List[float],
+                          tail_level: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute percentiles and the CVaR beyond one of them from a single partition
+
+    The samples are partitioned once around every order statistic the
+    percentiles interpolate between (the same linear method as
+    np.percentile), and the CVaR is taken from the partition's upper slice,
+    so no full-size comparison mask or sort is needed.
+
+    Args:
+        samples: Array of samples, one distribution per row along the last axis
+        levels: Percentile levels (0-100)
+        tail_level: Level in levels whose percentile the CVaR is taken beyond
+
+    Returns:
+        Tuple of (float64 percentile values with levels along the last axis,
+        float64 mean of the samples at or above the tail_level percentile -
+        a scalar for 1-D samples, one per row otherwise)
+    """
+    n = samples.shape[-1]
+    lower, upper, gamma, kth = _percentile_indices(n, tuple(levels))
+
+    partitioned = np.partition(samples, kth, axis=-1)
+    below, above = (partitioned[..., index].astype(np.float64) for index in (lower, upper))
+    diff = above - below
+    values = np.where(gamma >= 0.5, above - diff * (1 - gamma), below + diff * gamma)
+
+    # Everything from the upper order statistic on is >= the percentile; below
+    # it only values tied with the percentile itself belong to the tail
+    tail = levels.index(tail_level)
+    threshold, start = values[..., tail], upper[tail]
+    tail_sum = np.sum(partitioned[..., start:], axis=-1, dtype=np.float64)
+    tail_count = n - start
+    tied_rows = below[..., tail] == threshold
+    if np.any(tied_rows):
+        tied = np.count_nonzero(partitioned[..., :start] == threshold[..., None], axis=-1)
+        tied = np.where(tied_rows, tied, 0)
+        tail_sum = tail_sum + tied * threshold
+        tail_count = tail_count + tied
+    return values, (tail_sum / tail_count)[()]
+
+
+def _format_money(value: float, _pos: Optional[int] = None) -> str:
+    """
+    Format a dollar amount as a short chart label, e.g. $2.5M or $750K
+
+    Takes matplotlib FuncFormatter's (value, position) arguments, so it can be
+    used as an axis tick formatter as well as for bar annotations.
+
+    Args:
+        value: Dollar amount
+        _pos: Tick position (unused)
+
+    Returns:
+        Label string
+    """
+    return f'${value/1e6:.1f}M' if value >= 1e6 else f'${value/1e3:.0f}K'
+
+
 class FAIRRiskCalculator:
     """
     Automated FAIR risk calculation with Monte Carlo simulation
     """
     
-    def __init__(self, iterations: int = 10000, random_seed: Optional[int] = None):
+    # Smallest iteration count for which backend='cupy' moves batches to the GPU;
+    # below it the transfer and launch overhead outweighs the faster sampling
+    GPU_MIN_ITERATIONS = 100000
+
+    # PERT ranges narrower than this fraction of the mode (or of 1, for modes
+    # below 1) are treated as a point value
+    PERT_DEGENERATE_RTOL = 1e-12
+
+    def __init__(self, iterations: int = 10000, random_seed: Optional[int] = None,
+                 store_samples: bool = True, backend: str = 'numpy',
+                 sample_dtype: str = 'float64'):
         """
         Initialize the risk calculator
 
         Args:
             iterations: Number of Monte Carlo simulation iterations (default: 10000)
             random_seed: Optional random seed for reproducibility (default: None)
+            store_samples: Keep the raw per-iteration sample arrays in the results
+                           (default: True). If False, only the statistics and a
+                           small plotting summary are kept, and the Excel export
+                           omits the per-iteration Sim_ sheets.
+            backend: 'numpy' (default) or 'cupy'. With 'cupy', batched PERT
+                     simulations (run_simulations_batch/run_all_scenarios) of at
+                     least GPU_MIN_ITERATIONS iterations are sampled and
+                     summarised on the GPU; everything else runs on NumPy.
+            sample_dtype: 'float64' (default) or 'float32'. With 'float32' the
+                          sample arrays are stored in single precision, halving
+                          their memory and the bandwidth of the statistics pass.
+                          Statistics are still accumulated and reported in
+                          float64.
         """
         if iterations < 1000:
             raise ValueError("Iterations must be at least 1000 for statistical reliability")
         if iterations > 1000000:
             raise ValueError("Iterations cannot exceed 1,000,000 (memory/performance constraints)")
 
+        if backend not in ('numpy', 'cupy'):
+            raise ValueError(f"Invalid backend '{backend}'. Must be 'numpy' or 'cupy'")
+        if backend == 'cupy' and not CUPY_AVAILABLE:
+            raise ValueError("backend='cupy' requires the 'cupy' package "
+                             "(e.g. pip install cupy-cuda12x)")
+        if sample_dtype not in ('float64', 'float32'):
+            raise ValueError(f"Invalid sample_dtype '{sample_dtype}'. "
+                             "Must be 'float64' or 'float32'")
+
         self.iterations = iterations
+        self.store_samples = store_samples
+        self.backend = backend
+        self.sample_dtype = np.dtype(sample_dtype)
         self.scenarios = []
+        self._scenarios_by_id = {}  # First scenario added under each ID, for run_simulation()
         self.simulation_results = {}
+        self._sim_cache = {}  # Scenario ID -> (_sim_cache_key(), results) of its latest run
+        self._lef_ale_buffers = None  # (lef, ale) arrays reused while samples are not kept
+
+        # Bumped whenever scenarios or results change; invalidates the caches below
+        self._results_version = 0
+        self._summary_cache = None  # (version, distribution, summary DataFrame)
+        self._saved_comparison = None  # (save_path, data digest) of the last saved comparison chart
+
+        # Per-instance PCG64 generator, seeded for reproducibility if provided
+        self._rng = np.random.default_rng(random_seed)
+
+    def reset_rng(self, seed: Optional[int] = None) -> None:
+        """
+        Re-seed the calculator's random generator
+
+        Reruns after a reset with the same seed draw the same samples as a
+        freshly constructed calculator with that random_seed.
+
+        Args:
+            seed: Random seed (default: None = fresh OS entropy)
+        """
+        self._rng = np.random.default_rng(seed)
 
-        # Set random seed for reproducibility if provided
-        if random_seed is not None:
-            np.random.seed(random_seed)
-        
     def add_scenario(self,
                     scenario_id: str,
                     description: str,
@@ -92,6 +337,97 @@ class FAIRRiskCalculator:
         Raises:
             ValueError: If any parameter values are not in ascending order (low <= medium <= high)
         """
+        scenario = self._scenario_record(
+            scenario_id, description, tef_low, tef_medium, tef_high,
+            vuln_low, vuln_medium, vuln_high, loss_low, loss_medium, loss_high,
+            asset, threat_actor, loss_effect, notes
+        )
+        self._validate_scenario(scenario)
+        self._store_scenario(scenario)
+
+    def add_scenarios(self, scenarios: Iterable[Dict]) -> None:
+        """
+        Add several risk scenarios at once (e.g. from a batch file)
+
+        All the scenarios' parameters are range-checked in one vectorized
+        pass; only scenarios failing it go through add_scenario()'s per-value
+        checks to build the error message. Nothing is added unless every
+        scenario is valid.
+
+        Args:
+            scenarios: Dictionaries of add_scenario() keyword arguments
+
+        Raises:
+            TypeError: If a dictionary has missing or unknown keys
+            ValueError: If any scenario's parameters are invalid (the first
+                        invalid scenario is reported)
+        """
+        scenarios = list(scenarios)
+        records = [self._scenario_record(**kwargs) for kwargs in scenarios]
+        if not records:
+            return
+
+        # (scenario, factor, level) array, read straight from the keyword arguments
+        params = np.array([_SCENARIO_PARAMETERS(kwargs) for kwargs in scenarios]).reshape(-1, 3, 3)
+        if params.dtype.kind in 'biuf':
+            low, medium, high = params[..., 0], params[..., 1], params[..., 2]
+            invalid = ~((low <= medium) & (medium <= high)).all(axis=1)
+            invalid |= ~((params[:, 1] >= 0) & (params[:, 1] <= 1)).all(axis=1)
+            invalid |= (params[:, [0, 2]] < 0).any(axis=(1, 2))
+            suspects = np.flatnonzero(invalid).tolist()
+        else:
+            # Not plain numbers - check each one as add_scenario() would
+            suspects = range(len(records))
+
+        for index in suspects:
+            self._validate_scenario(records[index])
+        for scenario in records:
+            self._store_scenario(scenario)
+
+    @staticmethod
+    def _scenario_record(scenario_id: str, description: str,
+                         tef_low: float, tef_medium: float, tef_high: float,
+                         vuln_low: float, vuln_medium: float, vuln_high: float,
+                         loss_low: float, loss_medium: float, loss_high: float,
+                         asset: str = "", threat_actor: str = "",
+                         loss_effect: str = "", notes: str = "") -> Dict:
+        """
+        Build the scenario dictionary stored in self.scenarios
+
+        Args:
+            Same as add_scenario()
+
+        Returns:
+            Scenario dictionary (not yet validated)
+        """
+        return {
+            'id': scenario_id,
+            'description': description,
+            'tef': {'low': tef_low, 'medium': tef_medium, 'high': tef_high},
+            'vulnerability': {'low': vuln_low, 'medium': vuln_medium, 'high': vuln_high},
+            'loss_magnitude': {'low': loss_low, 'medium': loss_medium, 'high': loss_high},
+            'asset': asset,
+            'threat_actor': threat_actor,
+            'loss_effect': loss_effect,
+            'notes': notes
+        }
+
+    @staticmethod
+    def _validate_scenario(scenario: Dict) -> None:
+        """
+        Check a scenario's parameters
+
+        Args:
+            scenario: Scenario dictionary from _scenario_record()
+
+        Raises:
+            ValueError: If any parameter values are invalid, listing every problem
+        """
+        levels = ('low', 'medium', 'high')
+        tef_low, tef_medium, tef_high = (scenario['tef'][level] for level in levels)
+        vuln_low, vuln_medium, vuln_high = (scenario['vulnerability'][level] for level in levels)
+        loss_low, loss_medium, loss_high = (scenario['loss_magnitude'][level] for level in levels)
+
         # Validate that low <= medium <= high for all parameters
         validation_errors = []
 
@@ -132,23 +468,22 @@ class FAIRRiskCalculator:
 
         # If there are any validation errors, raise ValueError with all errors
         if validation_errors:
-            error_message = f"Validation failed for scenario '{scenario_id}':\n" + "\n".join(f"  - {err}" for err in validation_errors)
+            error_message = (f"Validation failed for scenario '{scenario['id']}':\n"
+                             + "\n".join(f"  - {err}" for err in validation_errors))
             raise ValueError(error_message)
 
-        scenario = {
-            'id': scenario_id,
-            'description': description,
-            'tef': {'low': tef_low, 'medium': tef_medium, 'high': tef_high},
-            'vulnerability': {'low': vuln_low, 'medium': vuln_medium, 'high': vuln_high},
-            'loss_magnitude': {'low': loss_low, 'medium': loss_medium, 'high': loss_high},
-            'asset': asset,
-            'threat_actor': threat_actor,
-            'loss_effect': loss_effect,
-            'notes': notes
-        }
+    def _store_scenario(self, scenario: Dict) -> None:
+        """
+        Append a validated scenario
+
+        Args:
+            scenario: Scenario dictionary from _scenario_record()
+        """
         self.scenarios.append(scenario)
+        self._scenarios_by_id.setdefault(scenario['id'], scenario)
+        self._results_version += 1
         
-    def _pert_distribution(self, low: float, medium: float, high: float, size: int) -> np.ndarray:
+    def _pert_distribution(self, low, medium, high, size: int, xp=np) -> np.ndarray:
         """
         Generate PERT distribution values
         PERT (Program Evaluation and Review Technique) distribution is commonly used in risk analysis
@@ -157,29 +492,44 @@ class FAIRRiskCalculator:
         The PERT distribution is a special case of the Beta distribution scaled to [low, high]
         with the mode at 'medium'.
 
+        The parameters may also be length-K sequences, in which case all K
+        distributions are sampled in one Beta draw.
+
         Args:
-            low: Minimum value (must be ≤ medium)
-            medium: Most likely value (mode) (must be in [low, high])
-            high: Maximum value (must be ≥ medium)
-            size: Number of samples to generate
+            low: Minimum value (must be ≤ medium), or a length-K sequence of them
+            medium: Most likely value (mode) (must be in [low, high]), or a length-K sequence
+            high: Maximum value (must be ≥ medium), or a length-K sequence
+            size: Number of samples to generate (per distribution)
+            xp: Array module to sample with - numpy (default) or cupy, in which
+                case the samples stay on the GPU
 
         Returns:
-            Array of sampled values following PERT distribution
+            Array of sampled values following PERT distribution - shape (size,)
+            for scalar parameters, (K, size) for sequences
 
         Raises:
             ValueError: If medium is not between low and high
         """
+        scalar = np.ndim(low) == 0
+        low, medium, high = (xp.asarray(v, dtype=float) for v in (low, medium, high))
+
         # Validate that medium is between low and high
         # This validation is critical for proper Beta distribution parameters
-        if not (low <= medium <= high):
+        if not xp.all((low <= medium) & (medium <= high)):
             raise ValueError(
                 f"PERT distribution requires low ≤ medium ≤ high. "
                 f"Got: low={low}, medium={medium}, high={high}"
             )
 
-        # Handle degenerate case where all values are equal
-        if high == low:
-            return np.full(size, medium)
+        # One row per distribution
+        low, medium, high = (v.reshape(-1, 1) for v in (low, medium, high))
+
+        # Degenerate rows (all values equal, or a span lost in rounding next to
+        # the mode) come out constant at the mode rather than from a Beta draw
+        # over a span of a few ulps
+        span = high - low
+        degenerate = span <= self.PERT_DEGENERATE_RTOL * xp.maximum(1.0, xp.abs(medium))
+        safe_span = xp.where(degenerate, 1.0, span)
 
         # PERT uses a modified beta distribution
         # Shape parameter (lambda) typically 4 for moderate confidence
@@ -189,12 +539,33 @@ class FAIRRiskCalculator:
         # Calculate alpha and beta parameters for Beta distribution
         # These formulas ensure the mode of the scaled Beta distribution equals 'medium'
         # Alpha and beta are always ≥ 1 when low ≤ medium ≤ high
-        alpha = 1 + lambda_param * (medium - low) / (high - low)
-        beta = 1 + lambda_param * (high - medium) / (high - low)
+        alpha = 1 + lambda_param * (medium - low) / safe_span
+        beta = 1 + lambda_param * (high - medium) / safe_span
+
+        # A device generator is seeded from the instance generator so GPU runs are reproducible too
+        rng = self._rng
+        if xp is not np:
+            rng = xp.random.default_rng(int(self._rng.integers(0, 2**63 - 1)))
 
         # Generate beta distribution samples in [0, 1] and scale to [low, high]
-        samples = np.random.beta(alpha, beta, size)
-        return low + samples * (high - low)
+        # in place, so no temporaries the size of the draw are allocated
+        if xp is np:
+            # One scalar-parameter draw per row: NumPy's broadcasting beta path
+            # costs ~10% more per sample and fills rows in the same order, so
+            # the random stream is identical
+            samples = np.empty((len(low), size))
+            row_shapes = zip(alpha[:, 0].tolist(), beta[:, 0].tolist())
+            for row, (row_alpha, row_beta) in enumerate(row_shapes):
+                samples[row] = rng.beta(row_alpha, row_beta, size)
+        else:
+            samples = rng.beta(alpha, beta, (len(low), size))
+        samples *= span
+        samples += low
+        samples = samples.astype(self.sample_dtype, copy=False)
+        if degenerate.any():
+            rows = degenerate[:, 0]
+            samples[rows] = medium[rows]
+        return samples[0] if scalar else samples
     
     def _triangular_distribution(self, low: float, medium: float, high: float, size: int) -> np.ndarray:
         """
@@ -223,7 +594,11 @@ class FAIRRiskCalculator:
                 f"Got: low={low}, medium={medium}, high={high}"
             )
 
-        return np.random.triangular(low, medium, high, size)
+        # numpy's triangular rejects left == right - the distribution is a constant there
+        if high == low:
+            return np.full(size, medium, dtype=self.sample_dtype)
+
+        return self._rng.triangular(low, medium, high, size).astype(self.sample_dtype, copy=False)
     
     def run_simulation(self, scenario_id: str, distribution: str = 'pert') -> Dict:
         """
@@ -245,35 +620,23 @@ class FAIRRiskCalculator:
             ValueError: If scenario_id not found or distribution type invalid
         """
         # Find the scenario
-        scenario = next((s for s in self.scenarios if s['id'] == scenario_id), None)
+        scenario = self._scenarios_by_id.get(scenario_id)
         if not scenario:
             raise ValueError(f"Scenario {scenario_id} not found")
 
         # Validate distribution type
         if distribution not in ['pert', 'triangular']:
-            raise ValueError(f"Invalid distribution type '{distribution}'. Must be 'pert' or 'triangular'")
+            raise ValueError(f"Invalid distribution type '{distribution}'. "
+                             "Must be 'pert' or 'triangular'")
 
         # Generate random samples based on distribution type
         if distribution == 'pert':
-            tef_samples = self._pert_distribution(
-                scenario['tef']['low'],
-                scenario['tef']['medium'],
-                scenario['tef']['high'],
-                self.iterations
-            )
-
-            vuln_samples = self._pert_distribution(
-                scenario['vulnerability']['low'],
-                scenario['vulnerability']['medium'],
-                scenario['vulnerability']['high'],
-                self.iterations
-            )
-
-            loss_samples = self._pert_distribution(
-                scenario['loss_magnitude']['low'],
-                scenario['loss_magnitude']['medium'],
-                scenario['loss_magnitude']['high'],
-                self.iterations
+            # One Beta draw for all three factors, one row per factor
+            factors = ('tef', 'vulnerability', 'loss_magnitude')
+            low, medium, high = ([scenario[factor][level] for factor in factors]
+                                 for level in ('low', 'medium', 'high'))
+            tef_samples, vuln_samples, loss_samples = self._pert_distribution(
+                low, medium, high, self.iterations
             )
         else:  # triangular distribution
             tef_samples = self._triangular_distribution(
@@ -299,17 +662,21 @@ class FAIRRiskCalculator:
         
         # Calculate Loss Event Frequency (LEF) and Annual Loss Expectancy (ALE)
         # This is the core FAIR calculation: ALE = TEF × Vulnerability × Loss Magnitude
-        lef_samples = tef_samples * vuln_samples
-        ale_samples = lef_samples * loss_samples
+        lef_samples, ale_samples = _lef_ale(tef_samples, vuln_samples, loss_samples,
+                                            out=self._output_buffers(tef_samples.shape))
+
+        # All percentiles and the CVaR from one partition of the samples
+        # (statistics are reported in float64 whatever the sample dtype)
+        percentile_levels = [10, 25, 50, 75, 90, 95, 99]
+        percentile_values, cvar_95_value = _partition_statistics(ale_samples, percentile_levels, 95)
+        percentiles = dict(zip(percentile_levels, percentile_values))
 
-        # Calculate Value at Risk (VaR) once to avoid redundant computation
         # VaR at 95% confidence: the loss value that will not be exceeded with 95% probability
-        var_95_value = np.percentile(ale_samples, 95)
+        var_95_value = percentiles[95]
 
-        # Calculate Conditional Value at Risk (CVaR), also known as Expected Shortfall
+        # Conditional Value at Risk (CVaR), also known as Expected Shortfall
         # CVaR at 95%: the expected loss given that losses exceed the 95th percentile
         # This represents the average of the worst 5% of outcomes
-        cvar_95_value = np.mean(ale_samples[ale_samples >= var_95_value])
 
         # Calculate comprehensive statistics
         results = {
@@ -324,90 +691,647 @@ class FAIRRiskCalculator:
             'ale_samples': ale_samples,
             'statistics': {
                 # Central tendency measures
-                'mean_loss': np.mean(ale_samples),
-                'median_loss': np.median(ale_samples),
+                'mean_loss': np.mean(ale_samples, dtype=np.float64),
+                'median_loss': percentiles[50],
 
                 # Dispersion measures
                 # Using ddof=1 for sample standard deviation (unbiased estimator)
-                'std_loss': np.std(ale_samples, ddof=1),
-                'min_loss': np.min(ale_samples),
-                'max_loss': np.max(ale_samples),
+                'std_loss': np.std(ale_samples, ddof=1, dtype=np.float64),
+                'min_loss': np.float64(np.min(ale_samples)),
+                'max_loss': np.float64(np.max(ale_samples)),
 
                 # Percentiles for understanding the distribution shape
-                'percentile_10': np.percentile(ale_samples, 10),
-                'percentile_25': np.percentile(ale_samples, 25),
-                'percentile_50': np.percentile(ale_samples, 50),  # Same as median
-                'percentile_75': np.percentile(ale_samples, 75),
-                'percentile_90': np.percentile(ale_samples, 90),
-                'percentile_95': np.percentile(ale_samples, 95),
-                'percentile_99': np.percentile(ale_samples, 99),
+                'percentile_10': percentiles[10],
+                'percentile_25': percentiles[25],
+                'percentile_50': percentiles[50],  # Same as median
+                'percentile_75': percentiles[75],
+                'percentile_90': percentiles[90],
+                'percentile_95': percentiles[95],
+                'percentile_99': percentiles[99],
 
                 # Risk metrics
                 'var_95': var_95_value,  # Value at Risk (95% confidence)
                 'cvar_95': cvar_95_value,  # Conditional VaR / Expected Shortfall
 
                 # Probability metrics for decision-making thresholds
-                'probability_zero_loss': np.sum(ale_samples == 0) / len(ale_samples),
-                'probability_over_1m': np.sum(ale_samples > 1000000) / len(ale_samples),
-                'probability_over_5m': np.sum(ale_samples > 5000000) / len(ale_samples),
-                'probability_over_10m': np.sum(ale_samples > 10000000) / len(ale_samples),
+                # (count_nonzero counts a boolean mask without summing it as integers)
+                'probability_zero_loss': np.count_nonzero(ale_samples == 0) / len(ale_samples),
+                'probability_over_1m': np.count_nonzero(ale_samples > 1000000) / len(ale_samples),
+                'probability_over_5m': np.count_nonzero(ale_samples > 5000000) / len(ale_samples),
+                'probability_over_10m': np.count_nonzero(ale_samples > 10000000) / len(ale_samples),
             }
         }
 
+        if not self.store_samples:
+            self._drop_samples(results)
+
         self.simulation_results[scenario_id] = results
+        self._results_version += 1
         return results
     
-    def run_all_scenarios(self, distribution: str = 'pert') -> pd.DataFrame:
+    def _output_buffers(self, shape: Tuple[int, ...]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get reusable LEF/ALE output arrays for a simulation, if it may use them
+
+        Only runs with store_samples=False may share buffers - their sample
+        arrays are reduced to a summary and dropped before the next run, while
+        kept samples must stay independent. The arrays are reallocated when
+        the shape or sample dtype changes.
+
+        Args:
+            shape: Shape of the sample arrays
+
+        Returns:
+            Tuple of (lef, ale) arrays, or None if fresh arrays must be allocated
+        """
+        if self.store_samples:
+            return None
+        buffers = self._lef_ale_buffers
+        if buffers is None or buffers[0].shape != shape or buffers[0].dtype != self.sample_dtype:
+            buffers = self._lef_ale_buffers = (np.empty(shape, dtype=self.sample_dtype),
+                                               np.empty(shape, dtype=self.sample_dtype))
+        return buffers
+
+    def _sim_cache_key(self, scenario: Dict, distribution: str) -> str:
+        """
+        Build a content-addressed cache key for a scenario's simulation
+
+        Args:
+            scenario: Scenario dictionary
+            distribution: Type of distribution
+
+        Returns:
+            Hex digest covering the scenario inputs, distribution, iterations and sample dtype
+        """
+        payload = json.dumps(scenario, sort_keys=True, default=str)
+        payload += f"|{distribution}|{self.iterations}|{self.sample_dtype.name}"
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def iter_simulations(self,
+                         distribution: str = 'pert',
+                         parallel: bool = True,
+                         max_workers: Optional[int] = None,
+                         use_cache: bool = True) -> Iterator[Tuple[str, Dict]]:
+        """
+        Run simulations for all scenarios, yielding results as they finish
+
+        Scenarios are independent, so with parallel=True they are simulated in
+        separate processes. Workers write their sample arrays into one shared
+        memory block instead of pickling them back; only the statistics go
+        through the pool's pipe. Each scenario gets its own seed drawn from the
+        calculator's generator, so a seeded calculator produces the same
+        results whether it runs in parallel or sequentially. Python 3.7 has no
+        multiprocessing.shared_memory, so there they always run sequentially.
+
+        Scenarios whose inputs, distribution and iteration count are unchanged
+        since a previous call reuse the earlier results instead of being
+        re-simulated. Only each scenario ID's latest results are kept, so
+        editing a scenario replaces its cache entry rather than adding one.
+
+        Args:
+            distribution: Type of distribution ('pert' or 'triangular', default: 'pert')
+            parallel: If True, simulate scenarios in a process pool (default: True)
+            max_workers: Number of worker processes (default: None = CPU count)
+            use_cache: If True, reuse results for unchanged scenarios (default: True)
+
+        Yields:
+            Tuples of (scenario_id, results), in scenario order
+        """
+        seeds = [int(seed) for seed in self._rng.integers(0, 2**31 - 1, size=len(self.scenarios))]
+        keys = [self._sim_cache_key(scenario, distribution) for scenario in self.scenarios]
+        # Look every hit up before simulating - a repeated ID may replace its entry below
+        cached = [self._sim_cache.get(scenario['id'], (None, None)) for scenario in self.scenarios]
+        hits = [results if use_cache and cached_key == key else None
+                for key, (cached_key, results) in zip(keys, cached)]
+        pending = [i for i, results in enumerate(hits) if results is None]
+
+        executor = shm = None
+        futures = []
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        if parallel and workers > 1:
+            try:
+                from multiprocessing import shared_memory  # Python 3.8+
+            except ImportError:
+                workers = 1  # No shared memory to return samples through - run sequentially
+        if parallel and workers > 1:
+            # One (scenario, sample array, iteration) block of sample_dtype for all workers
+            sample_keys = [key for _, key in self.SIMULATION_SHEET_COLUMNS]
+            shape = (len(pending), len(sample_keys), self.iterations)
+            shm = shared_memory.SharedMemory(create=True,
+                                             size=int(np.prod(shape)) * self.sample_dtype.itemsize)
+            samples = np.ndarray(shape, dtype=self.sample_dtype, buffer=shm.buf)
+            executor = ProcessPoolExecutor(max_workers=workers)
+            futures = [executor.submit(_simulate_scenario, self.scenarios[i], self.iterations,
+                                       distribution, seeds[i], shm.name, row,
+                                       self.sample_dtype.name)
+                       for row, i in enumerate(pending)]
+            completed = (future.result() for future in futures)
+
+        try:
+            rows = {i: row for row, i in enumerate(pending)}
+            for i, (scenario, key, results) in enumerate(zip(self.scenarios, keys, hits)):
+                if i in rows:
+                    if executor is not None:
+                        _, results = next(completed)
+                        # Copy out of the shared block, which is freed below
+                        scenario_samples = samples[rows[i]].copy()
+                        results.update(zip(sample_keys, scenario_samples))
+                        if not self.store_samples:
+                            self._drop_samples(results)
+                    else:
+                        results = self._run_seeded_simulation(scenario['id'], distribution,
+                                                              seeds[i])
+                    self._sim_cache[scenario['id']] = (key, results)
+                self.simulation_results[scenario['id']] = results
+                self._results_version += 1
+                yield scenario['id'], results
+        finally:
+            if executor is not None:
+                # Drop work not yet started if the caller stopped early
+                # (shutdown(cancel_futures=True) needs Python 3.9+)
+                for future in futures:
+                    future.cancel()
+                executor.shutdown()
+            if shm is not None:
+                del samples  # Release the buffer export before closing
+                shm.close()
+                shm.unlink()
+
+    def _run_seeded_simulation(self, scenario_id: str, distribution: str, seed: int) -> Dict:
+        """
+        Run one scenario's simulation from its own seed, as a worker process would
+
+        Args:
+            scenario_id: ID of the scenario to simulate
+            distribution: Type of distribution ('pert' or 'triangular')
+            seed: Random seed for this scenario
+
+        Returns:
+            Dictionary containing simulation results
+        """
+        instance_rng = self._rng
+        self._rng = np.random.default_rng(seed)
+        try:
+            return self.run_simulation(scenario_id, distribution)
+        finally:
+            self._rng = instance_rng
+
+    def run_simulations_batch(self, distribution: str = 'pert') -> List[Dict]:
+        """
+        Run Monte Carlo simulations for all scenarios in single vectorized draws
+
+        Instead of sampling each scenario separately, the low/medium/high
+        parameters of every factor of every scenario are stacked and drawn in
+        a single call as one contiguous (3 * n_scenarios, iterations) array. The
+        statistics are then computed along the iteration axis, with all
+        percentiles taken in one pass.
+
+        Args:
+            distribution: Type of distribution ('pert' or 'triangular', default: 'pert')
+
+        Returns:
+            List of result dictionaries (same layout as run_simulation()), in scenario order
+
+        Raises:
+            ValueError: If distribution type invalid
+        """
+        if distribution not in ['pert', 'triangular']:
+            raise ValueError(f"Invalid distribution type '{distribution}'. "
+                             "Must be 'pert' or 'triangular'")
+
+        if not self.scenarios:
+            return []
+
+        # Parameters as flat (3 * n_scenarios,) arrays, factor-major: all TEF rows,
+        # then all vulnerability rows, then all loss magnitude rows
+        factors = ('tef', 'vulnerability', 'loss_magnitude')
+        low, medium, high = (np.array([s[factor][level]
+                                       for factor in factors for s in self.scenarios], dtype=float)
+                             for level in ('low', 'medium', 'high'))
+
+        # Array module for the draw and statistics: CuPy only for large PERT batches
+        xp = np
+        if (self.backend == 'cupy' and distribution == 'pert'
+                and self.iterations >= self.GPU_MIN_ITERATIONS):
+            import cupy as xp
+
+        # One draw for every factor of every scenario
+        if distribution == 'pert':
+            samples = self._pert_distribution(low, medium, high, self.iterations, xp=xp)
+        else:
+            low, medium, high = low[:, None], medium[:, None], high[:, None]
+            degenerate = high == low
+
+            # numpy's triangular rejects left == right - degenerate rows are constant anyway.
+            # The right bound is high itself: low + (high - low) can round below the mode.
+            right = np.where(degenerate, low + 1.0, high)
+            samples = self._rng.triangular(low, medium, right, (len(low), self.iterations))
+            samples = np.where(degenerate, low, samples).astype(self.sample_dtype, copy=False)
+
+        tef_samples, vuln_samples, loss_samples = samples.reshape(len(factors), len(self.scenarios),
+                                                                  self.iterations)
+
+        # ALE = TEF × Vulnerability × Loss Magnitude
+        if xp is np:
+            lef_samples, ale_samples = _lef_ale(tef_samples, vuln_samples, loss_samples,
+                                                out=self._output_buffers(tef_samples.shape))
+        else:
+            lef_samples = tef_samples * vuln_samples
+            ale_samples = lef_samples * loss_samples
+
+        percentile_levels = [10, 25, 50, 75, 90, 95, 99]
+        if xp is np:
+            # Every row's percentiles and CVaR from one partition of the batch
+            percentile_values, cvar_95 = _partition_statistics(ale_samples, percentile_levels, 95)
+            percentiles = dict(zip(percentile_levels, percentile_values.T))
+            var_95 = percentiles[95]
+        else:
+            percentiles = dict(zip(percentile_levels,
+                                   xp.percentile(ale_samples, xp.asarray(percentile_levels),
+                                                 axis=1).astype(xp.float64)))
+            var_95 = percentiles[95]
+            tail = ale_samples >= var_95[:, None]
+            cvar_95 = xp.sum(ale_samples * tail, axis=1, dtype=xp.float64) / xp.sum(tail, axis=1)
+
+        # Statistics are accumulated and reported in float64 whatever the sample dtype
+        mean_loss = xp.mean(ale_samples, axis=1, dtype=xp.float64)
+        std_loss = xp.std(ale_samples, axis=1, ddof=1, dtype=xp.float64)
+        min_loss = xp.min(ale_samples, axis=1).astype(xp.float64)
+        max_loss = xp.max(ale_samples, axis=1).astype(xp.float64)
+        n = self.iterations
+        probability_zero = xp.count_nonzero(ale_samples == 0, axis=1) / n
+        probability_over_1m = xp.count_nonzero(ale_samples > 1000000, axis=1) / n
+        probability_over_5m = xp.count_nonzero(ale_samples > 5000000, axis=1) / n
+        probability_over_10m = xp.count_nonzero(ale_samples > 10000000, axis=1) / n
+
+        if xp is not np:
+            # Copy the finished arrays back to the host in one go
+            (tef_samples, vuln_samples, loss_samples, lef_samples, ale_samples, var_95, cvar_95,
+             mean_loss, std_loss, min_loss, max_loss, probability_zero, probability_over_1m,
+             probability_over_5m, probability_over_10m) = (
+                xp.asnumpy(values) for values in (
+                    tef_samples, vuln_samples, loss_samples, lef_samples, ale_samples, var_95,
+                    cvar_95, mean_loss, std_loss, min_loss, max_loss, probability_zero,
+                    probability_over_1m, probability_over_5m, probability_over_10m))
+            percentiles = {level: xp.asnumpy(values) for level, values in percentiles.items()}
+
+        batch_results = []
+        for i, scenario in enumerate(self.scenarios):
+            results = {
+                'scenario_id': scenario['id'],
+                'description': scenario['description'],
+                'iterations': self.iterations,
+                'distribution_type': distribution,
+                'tef_samples': tef_samples[i],
+                'vuln_samples': vuln_samples[i],
+                'loss_samples': loss_samples[i],
+                'lef_samples': lef_samples[i],
+                'ale_samples': ale_samples[i],
+                'statistics': {
+                    'mean_loss': mean_loss[i],
+                    'median_loss': percentiles[50][i],
+                    'std_loss': std_loss[i],
+                    'min_loss': min_loss[i],
+                    'max_loss': max_loss[i],
+                    'percentile_10': percentiles[10][i],
+                    'percentile_25': percentiles[25][i],
+                    'percentile_50': percentiles[50][i],
+                    'percentile_75': percentiles[75][i],
+                    'percentile_90': percentiles[90][i],
+                    'percentile_95': percentiles[95][i],
+                    'percentile_99': percentiles[99][i],
+                    'var_95': var_95[i],
+                    'cvar_95': cvar_95[i],
+                    'probability_zero_loss': probability_zero[i],
+                    'probability_over_1m': probability_over_1m[i],
+                    'probability_over_5m': probability_over_5m[i],
+                    'probability_over_10m': probability_over_10m[i],
+                }
+            }
+            if not self.store_samples:
+                self._drop_samples(results)
+            self.simulation_results[scenario['id']] = results
+            batch_results.append(results)
+
+        self._results_version += 1
+        return batch_results
+
+    @staticmethod
+    def _factor_moments(low: float, medium: float, high: float,
+                        distribution: str) -> Tuple[float, float]:
+        """
+        First and second raw moments of one FAIR factor's distribution
+
+        Args:
+            low: Minimum value
+            medium: Most likely value
+            high: Maximum value
+            distribution: 'pert' or 'triangular'
+
+        Returns:
+            Tuple of (E[X], E[X²])
+        """
+        if distribution == 'pert':
+            # PERT with lambda = 4 is a Beta(alpha, beta) on [low, high] with alpha + beta = 6
+            mean = (low + 4 * medium + high) / 6
+            span = high - low
+            alpha = 1 + 4 * (medium - low) / span if span else 1.0
+            beta = 6 - alpha
+            variance = span ** 2 * alpha * beta / (6 ** 2 * 7)
+        else:
+            mean = (low + medium + high) / 3
+            variance = (low ** 2 + medium ** 2 + high ** 2
+                        - low * medium - low * high - medium * high) / 18
+        return mean, variance + mean ** 2
+
+    def analytic_statistics(self, distribution: str = 'pert') -> List[Dict]:
+        """
+        Approximate each scenario's loss statistics without simulating
+
+        TEF, vulnerability and loss magnitude are independent, so the mean and
+        variance of their product follow exactly from each factor's moments:
+        E[ALE] = E[T]E[V]E[L] and Var[ALE] = E[T²]E[V²]E[L²] - E[ALE]². The
+        percentiles, tail and threshold probabilities come from a lognormal
+        with that mean and variance, so they are estimates - use the Monte Carlo
+        results for anything beyond a quick overview. No samples are drawn and
+        simulation_results is left untouched.
+
+        Args:
+            distribution: Type of distribution ('pert' or 'triangular', default: 'pert')
+
+        Returns:
+            List of result dictionaries holding scenario_id, description and the
+            same 'statistics' keys as run_simulation(), in scenario order
+
+        Raises:
+            ValueError: If distribution type invalid
+        """
+        if distribution not in ['pert', 'triangular']:
+            raise ValueError(f"Invalid distribution type '{distribution}'. "
+                             "Must be 'pert' or 'triangular'")
+
+        from statistics import NormalDist  # Python 3.8+, only needed on this opt-in path
+
+        standard_normal = NormalDist()
+        percentile_levels = (10, 25, 50, 75, 90, 95, 99)
+        thresholds = {'probability_over_1m': 1000000, 'probability_over_5m': 5000000,
+                      'probability_over_10m': 10000000}
+
+        analytic_results = []
+        for scenario in self.scenarios:
+            mean_loss, second_moment = 1.0, 1.0
+            min_loss, max_loss = 1.0, 1.0
+            for factor in ('tef', 'vulnerability', 'loss_magnitude'):
+                params = scenario[factor]
+                mean, raw_second = self._factor_moments(params['low'], params['medium'],
+                                                        params['high'], distribution)
+                mean_loss *= mean
+                second_moment *= raw_second
+                min_loss *= params['low']
+                max_loss *= params['high']
+            variance = max(second_moment - mean_loss ** 2, 0.0)
+
+            if mean_loss > 0 and variance > 0:
+                # Lognormal with matched mean and variance
+                sigma = np.sqrt(np.log1p(variance / mean_loss ** 2))
+                mu = np.log(mean_loss) - sigma ** 2 / 2
+                percentiles = {
+                    level: float(np.exp(mu + sigma * standard_normal.inv_cdf(level / 100)))
+                    for level in percentile_levels
+                }
+                # E[X | X ≥ VaR95] for a lognormal
+                cvar_95 = (mean_loss * standard_normal.cdf(sigma - standard_normal.inv_cdf(0.95))
+                           / 0.05)
+                probabilities = {key: 1 - standard_normal.cdf((np.log(threshold) - mu) / sigma)
+                                 for key, threshold in thresholds.items()}
+                probability_zero = 0.0
+            else:
+                # Every sample would be the same value
+                percentiles = dict.fromkeys(percentile_levels, mean_loss)
+                cvar_95 = mean_loss
+                probabilities = {key: float(mean_loss > threshold)
+                                 for key, threshold in thresholds.items()}
+                probability_zero = float(mean_loss == 0)
+
+            analytic_results.append({
+                'scenario_id': scenario['id'],
+                'description': scenario['description'],
+                'distribution_type': distribution,
+                'statistics': {
+                    'mean_loss': mean_loss,
+                    'median_loss': percentiles[50],
+                    'std_loss': float(np.sqrt(variance)),
+                    'min_loss': min_loss,
+                    'max_loss': max_loss,
+                    **{f'percentile_{level}': value for level, value in percentiles.items()},
+                    'var_95': percentiles[95],
+                    'cvar_95': cvar_95,
+                    'probability_zero_loss': probability_zero,
+                    **probabilities,
+                }
+            })
+
+        return analytic_results
+
+    def run_all_scenarios(self, distribution: str = 'pert', parallel: bool = False,
+                          max_workers: Optional[int] = None, fast: bool = False,
+                          force: bool = False) -> 'pd.DataFrame':
         """
         Run simulation for all added scenarios
+
+        By default all scenarios are simulated in one vectorized batch. With
+        parallel=True they go through iter_simulations() instead: one process
+        per scenario, and scenarios already simulated with the same inputs
+        reuse their earlier results.
+
+        The summary is cached until a scenario is added or any simulation is
+        re-run, so repeated comparisons/exports reuse it. If every scenario
+        already has results for this distribution and iteration count (e.g.
+        from run_simulation() or iter_simulations()), the summary is built from
+        those instead of simulating again, unless force=True.
+
+        With fast=True nothing is simulated: the table is built from
+        analytic_statistics() instead, which is exact for the mean and standard
+        deviation and a lognormal approximation for everything else.
         
         Args:
-            distribution: Type of distribution ('pert' or 'uniform')
+            distribution: Type of distribution ('pert' or 'triangular', default: 'pert')
+            parallel: If True, simulate in a process pool via iter_simulations() (default: False)
+            max_workers: Number of worker processes when parallel (default: None = CPU count)
+            fast: If True, return the analytic approximation instead of simulating
+                  (default: False)
+            force: If True, re-simulate even when every scenario already has results
+                   (default: False)
             
         Returns:
             DataFrame with results for all scenarios
         """
-        results_list = []
-        for scenario in self.scenarios:
-            result = self.run_simulation(scenario['id'], distribution)
-            results_list.append({
-                'Scenario ID': scenario['id'],
-                'Description': scenario['description'],
-                'Mean Loss': result['statistics']['mean_loss'],
-                'Median Loss': result['statistics']['median_loss'],
-                'Std Dev': result['statistics']['std_loss'],
-                '10th Percentile': result['statistics']['percentile_10'],
-                '90th Percentile': result['statistics']['percentile_90'],
-                '95th Percentile (VaR)': result['statistics']['var_95'],
-                'CVaR 95%': result['statistics']['cvar_95'],
-                'P(Loss = 0)': result['statistics']['probability_zero_loss'],
-                'P(Loss > $1M)': result['statistics']['probability_over_1m'],
-                'P(Loss > $5M)': result['statistics']['probability_over_5m']
-            })
+        import pandas as pd
+
+        if fast:
+            return pd.DataFrame([self._summary_row(result)
+                                 for result in self.analytic_statistics(distribution)])
+
+        if self._summary_cache is not None and not force:
+            version, cached_distribution, summary_df = self._summary_cache
+            if version == self._results_version and cached_distribution == distribution:
+                return summary_df.copy()
+
+        existing = [self.simulation_results.get(scenario['id']) for scenario in self.scenarios]
+        if not force and existing and all(
+                result is not None and result['distribution_type'] == distribution
+                and result['iterations'] == self.iterations for result in existing):
+            all_results = existing
+        elif parallel:
+            all_results = [results for _, results in
+                           self.iter_simulations(distribution=distribution, max_workers=max_workers,
+                                                 use_cache=not force)]
+        else:
+            all_results = self.run_simulations_batch(distribution)
+        results_list = [self._summary_row(result) for result in all_results]
         
-        return pd.DataFrame(results_list)
+        summary_df = pd.DataFrame(results_list)
+        self._summary_cache = (self._results_version, distribution, summary_df)
+        return summary_df.copy()
     
-    def create_visualizations(self, scenario_id: str, save_path: Optional[str] = None) -> None:
+    # Bin counts of the analysis figure's histograms, by sample array
+    PLOT_HISTOGRAM_BINS = {'ale_samples': 50, 'tef_samples': 30, 'vuln_samples': 30}
+
+    # Approximate number of sorted ALE samples kept for the CDF and box plot outliers
+    PLOT_QUANTILE_POINTS = 2048
+
+    @classmethod
+    def _sample_summary(cls, results: Dict, all_fliers: bool = False) -> Dict:
+        """
+        Reduce a scenario's sample arrays to what its analysis figure plots
+
+        Args:
+            results: Simulation results including the sample arrays
+            all_fliers: Keep every box plot outlier rather than only those
+                        among the CDF points (default: False)
+
+        Returns:
+            Dictionary with 'histograms' (sample key -> (counts, bin edges)),
+            'ale_cdf' (evenly spaced points of the empirical CDF, including the
+            minimum and maximum) and 'ale_box' (box plot statistics for Axes.bxp)
+        """
+        histograms = {key: np.histogram(results[key], bins=bins)
+                      for key, bins in cls.PLOT_HISTOGRAM_BINS.items()}
+
+        ale_sorted = np.sort(results['ale_samples'])
+        n = len(ale_sorted)
+        ranks = np.unique(np.append(np.arange(0, n, max(1, n // cls.PLOT_QUANTILE_POINTS)), n - 1))
+        cdf_values = ale_sorted[ranks]
+
+        # Same 1.5 × IQR whisker rule as Axes.boxplot
+        stats = results['statistics']
+        q1, median, q3 = stats['percentile_25'], stats['percentile_50'], stats['percentile_75']
+        iqr = q3 - q1
+        whislo = ale_sorted[np.searchsorted(ale_sorted, q1 - 1.5 * iqr, side='left')]
+        whishi = ale_sorted[np.searchsorted(ale_sorted, q3 + 1.5 * iqr, side='right') - 1]
+        box = {
+            'med': median, 'q1': q1, 'q3': q3, 'whislo': whislo, 'whishi': whishi,
+            'fliers': (ale_sorted[(ale_sorted < whislo) | (ale_sorted > whishi)] if all_fliers
+                       else cdf_values[(cdf_values < whislo) | (cdf_values > whishi)]),
+        }
+
+        return {
+            'histograms': histograms,
+            'ale_cdf': (cdf_values, (ranks + 1) / n),
+            'ale_box': box,
+        }
+
+    def _render_payload(self, results: Dict) -> Dict:
+        """
+        Copy a result for a render worker, with its sample arrays summarised
+
+        Only the summary crosses the process boundary, so a render job pickles
+        a few kilobytes rather than every raw sample array.
+
+        Args:
+            results: Simulation results for a scenario
+
+        Returns:
+            Copy of the results without the sample arrays and with a
+            'sample_summary' that keeps every box plot outlier
+        """
+        sample_keys = {key for _, key in self.SIMULATION_SHEET_COLUMNS}
+        payload = {key: value for key, value in results.items() if key not in sample_keys}
+        if 'sample_summary' not in payload:
+            payload['sample_summary'] = self._sample_summary(results, all_fliers=True)
+        return payload
+
+    def _drop_samples(self, results: Dict) -> None:
+        """
+        Replace a result's raw sample arrays with its plotting summary (in place)
+
+        Args:
+            results: Simulation results including the sample arrays
+        """
+        results['sample_summary'] = self._sample_summary(results)
+        for _, key in self.SIMULATION_SHEET_COLUMNS:
+            del results[key]
+
+    @staticmethod
+    def _summary_row(result: Dict) -> Dict:
+        """
+        Build one row of the scenario summary table
+
+        Args:
+            result: Simulation results for a scenario
+
+        Returns:
+            Dictionary mapping summary column names to values
+        """
+        stats = result['statistics']
+        return {
+            'Scenario ID': result['scenario_id'],
+            'Description': result['description'],
+            'Mean Loss': stats['mean_loss'],
+            'Median Loss': stats['median_loss'],
+            'Std Dev': stats['std_loss'],
+            '10th Percentile': stats['percentile_10'],
+            '90th Percentile': stats['percentile_90'],
+            '95th Percentile (VaR)': stats['var_95'],
+            'CVaR 95%': stats['cvar_95'],
+            'P(Loss = 0)': stats['probability_zero_loss'],
+            'P(Loss > $1M)': stats['probability_over_1m'],
+            'P(Loss > $5M)': stats['probability_over_5m']
+        }
+
+    def create_visualizations(self, scenario_id: str, save_path: Optional[str] = None,
+                              fig: Optional['Figure'] = None) -> None:
         """
         Create comprehensive visualizations for a scenario
         
         Args:
             scenario_id: ID of the scenario to visualize
             save_path: Optional path to save the figure
+            fig: Optional existing figure (pyplot or plain Figure) to draw into.
+                 It is cleared first and not shown, so one figure can be reused
+                 to save many scenarios.
         """
         if scenario_id not in self.simulation_results:
             raise ValueError(f"No simulation results for scenario {scenario_id}")
         
         results = self.simulation_results[scenario_id]
-        ale_samples = results['ale_samples']
+        summary = results.get('sample_summary') or self._sample_summary(results, all_fliers=True)
+        histograms = summary['histograms']
         
-        # Create figure with subplots
-        fig = plt.figure(figsize=(16, 10))
+        # Create figure with subplots (or reuse the caller's figure)
+        owns_figure = fig is None
+        if owns_figure:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(16, 10))
+        else:
+            fig.clf()
+        from matplotlib.ticker import FuncFormatter
         fig.suptitle(f'FAIR Risk Analysis - {results["description"]}', fontsize=16, fontweight='bold')
         
         # 1. Loss Distribution Histogram
-        ax1 = plt.subplot(2, 3, 1)
-        n, bins, patches = ax1.hist(ale_samples, bins=50, edgecolor='black', alpha=0.7)
+        ax1 = fig.add_subplot(2, 3, 1)
+        counts, edges = histograms['ale_samples']
+        ax1.hist(edges[:-1], edges, weights=counts, edgecolor='black', alpha=0.7)
         ax1.axvline(results['statistics']['mean_loss'], color='red', linestyle='--', label=f'Mean: ${results["statistics"]["mean_loss"]:,.0f}')
         ax1.axvline(results['statistics']['percentile_90'], color='orange', linestyle='--', label=f'90th %ile: ${results["statistics"]["percentile_90"]:,.0f}')
         ax1.axvline(results['statistics']['var_95'], color='darkred', linestyle='--', label=f'VaR 95%: ${results["statistics"]["var_95"]:,.0f}')
@@ -418,13 +1342,11 @@ class FAIRRiskCalculator:
         ax1.grid(True, alpha=0.3)
         
         # Format x-axis
-        ax1.ticklabel_format(style='plain', axis='x')
-        ax1.set_xticklabels([f'${x/1e6:.1f}M' if x >= 1e6 else f'${x/1e3:.0f}K' for x in ax1.get_xticks()])
+        ax1.xaxis.set_major_formatter(FuncFormatter(_format_money))
         
         # 2. Cumulative Distribution
-        ax2 = plt.subplot(2, 3, 2)
-        sorted_losses = np.sort(ale_samples)
-        cumulative = np.arange(1, len(sorted_losses) + 1) / len(sorted_losses)
+        ax2 = fig.add_subplot(2, 3, 2)
+        sorted_losses, cumulative = summary['ale_cdf']
         ax2.plot(sorted_losses, cumulative, linewidth=2)
         ax2.axhline(0.5, color='blue', linestyle=':', alpha=0.5, label='Median')
         ax2.axhline(0.9, color='orange', linestyle=':', alpha=0.5, label='90th Percentile')
@@ -434,29 +1356,29 @@ class FAIRRiskCalculator:
         ax2.set_title('Cumulative Distribution Function')
         ax2.legend()
         ax2.grid(True, alpha=0.3)
-        ax2.set_xticklabels([f'${x/1e6:.1f}M' if x >= 1e6 else f'${x/1e3:.0f}K' for x in ax2.get_xticks()])
+        ax2.xaxis.set_major_formatter(FuncFormatter(_format_money))
         
         # 3. Box Plot with Percentiles
-        ax3 = plt.subplot(2, 3, 3)
-        box_data = pd.DataFrame({'Annual Loss': ale_samples})
-        bp = ax3.boxplot(ale_samples, vert=True, patch_artist=True)
+        ax3 = fig.add_subplot(2, 3, 3)
+        bp = ax3.bxp([summary['ale_box']], patch_artist=True)
         bp['boxes'][0].set_facecolor('lightblue')
         
         # Add percentile markers
         percentiles = [10, 25, 50, 75, 90, 95, 99]
         for p in percentiles:
-            val = np.percentile(ale_samples, p)
+            val = results['statistics'][f'percentile_{p}']
             ax3.axhline(val, color='gray', linestyle=':', alpha=0.3)
             ax3.text(1.15, val, f'{p}%: ${val:,.0f}', fontsize=8)
         
         ax3.set_ylabel('Annual Loss Expectancy ($)')
         ax3.set_title('Loss Distribution Box Plot')
         ax3.grid(True, alpha=0.3)
-        ax3.set_yticklabels([f'${y/1e6:.1f}M' if y >= 1e6 else f'${y/1e3:.0f}K' for y in ax3.get_yticks()])
+        ax3.yaxis.set_major_formatter(FuncFormatter(_format_money))
         
         # 4. Risk Components Distribution
-        ax4 = plt.subplot(2, 3, 4)
-        ax4.hist(results['tef_samples'], bins=30, alpha=0.5, label='TEF', color='blue')
+        ax4 = fig.add_subplot(2, 3, 4)
+        counts, edges = histograms['tef_samples']
+        ax4.hist(edges[:-1], edges, weights=counts, alpha=0.5, label='TEF', color='blue')
         ax4.set_xlabel('Threat Event Frequency')
         ax4.set_ylabel('Frequency')
         ax4.set_title('TEF Distribution')
@@ -464,8 +1386,9 @@ class FAIRRiskCalculator:
         ax4.grid(True, alpha=0.3)
         
         # 5. Vulnerability Distribution
-        ax5 = plt.subplot(2, 3, 5)
-        ax5.hist(results['vuln_samples'], bins=30, alpha=0.5, label='Vulnerability', color='green')
+        ax5 = fig.add_subplot(2, 3, 5)
+        counts, edges = histograms['vuln_samples']
+        ax5.hist(edges[:-1], edges, weights=counts, alpha=0.5, label='Vulnerability', color='green')
         ax5.set_xlabel('Vulnerability (%)')
         ax5.set_ylabel('Frequency')
         ax5.set_title('Vulnerability Distribution')
@@ -473,7 +1396,7 @@ class FAIRRiskCalculator:
         ax5.grid(True, alpha=0.3)
         
         # 6. Risk Statistics Table
-        ax6 = plt.subplot(2, 3, 6)
+        ax6 = fig.add_subplot(2, 3, 6)
         ax6.axis('off')
         
         stats_text = f"""
@@ -505,14 +1428,173 @@ class FAIRRiskCalculator:
                 verticalalignment='top', fontfamily='monospace',
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
             print(f"Visualization saved to {save_path}")
         
-        plt.show()
+        if owns_figure:
+            plt.show()
     
+    def save_all_visualizations(self, save_dir: str, parallel: bool = True,
+                                max_workers: Optional[int] = None) -> List[str]:
+        """
+        Render and save the analysis figure for every simulated scenario
+
+        Figures are drawn onto plain matplotlib Figures (no pyplot/GUI state)
+        that are reused between scenarios. With parallel=True the scenarios
+        are rendered in a process pool, each worker reusing its own figure.
+
+        Args:
+            save_dir: Directory to save the figures in
+            parallel: If True, render scenarios in separate processes (default: True)
+            max_workers: Number of worker processes (default: None = min(8, CPU count))
+
+        Returns:
+            List of saved file paths, in scenario order
+        """
+        scenario_ids = list(self.simulation_results.keys())
+        save_paths = [analysis_plot_path(save_dir, sid) for sid in scenario_ids]
+
+        workers = min(max_workers or min(8, os.cpu_count() or 1), len(scenario_ids))
+        if parallel and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_render_scenario_figure,
+                                  [self._render_payload(self.simulation_results[sid])
+                                   for sid in scenario_ids],
+                                  save_paths))
+        else:
+            from matplotlib.figure import Figure
+            shared_fig = Figure(figsize=(16, 10))
+            for sid, save_path in zip(scenario_ids, save_paths):
+                self.create_visualizations(sid, save_path, fig=shared_fig)
+
+        return save_paths
+
+    def simulate_and_save_visualizations(self, save_dir: str, distribution: str = 'pert',
+                                         parallel: bool = True,
+                                         max_workers: Optional[int] = None) -> List[str]:
+        """
+        Simulate all scenarios and save their figures, overlapping the two
+
+        Each scenario's figure is submitted for rendering as soon as its
+        simulation finishes, so plotting runs while later scenarios are
+        still being simulated.
+
+        Args:
+            save_dir: Directory to save the figures in
+            distribution: Type of distribution ('pert' or 'triangular', default: 'pert')
+            parallel: If True, simulate and render in process pools (default: True)
+            max_workers: Number of render processes (default: None = min(8, CPU count))
+
+        Returns:
+            List of saved file paths, in scenario order
+        """
+        return self.simulate_and_export(save_dir=save_dir, distribution=distribution,
+                                        parallel=parallel, max_workers=max_workers)
+
+    def simulate_and_export(self, save_dir: Optional[str] = None,
+                            excel_filename: Optional[str] = None,
+                            json_filename: Optional[str] = None,
+                            distribution: str = 'pert', parallel: bool = True,
+                            max_workers: Optional[int] = None) -> List[str]:
+        """
+        Simulate all scenarios and save figures/exports in a single pass
+
+        Each scenario is handled completely while its samples are fresh: its
+        figure is rendered (in a process pool when parallel), its Sim_ sheet
+        rows and summary row are streamed to the workbook and its JSON entry
+        is recorded. Unlike export_to_excel(), the exports describe exactly
+        the results that were plotted - nothing is re-simulated.
+
+        Args:
+            save_dir: Directory to save the figures in (default: None = no figures)
+            excel_filename: Excel export filename (default: None = no Excel export)
+            json_filename: JSON export filename (default: None = no JSON export)
+            distribution: Type of distribution ('pert' or 'triangular', default: 'pert')
+            parallel: If True, simulate and render in process pools (default: True)
+            max_workers: Number of render processes (default: None = min(8, CPU count))
+
+        Returns:
+            List of saved figure paths, in scenario order
+        """
+        workers = min(max_workers or min(8, os.cpu_count() or 1), max(len(self.scenarios), 1))
+        render_executor = None
+        if save_dir and parallel and workers >= 2:
+            render_executor = ProcessPoolExecutor(max_workers=workers)
+
+        # Stream rows straight into the workbook when xlsxwriter is available;
+        # otherwise collect the summary and write it with openpyxl afterwards
+        workbook = summary_sheet = None
+        if excel_filename and XLSXWRITER_AVAILABLE:
+            import xlsxwriter
+            workbook = xlsxwriter.Workbook(excel_filename, {'constant_memory': True})
+            header_format = workbook.add_format({'bold': True, 'border': 1})
+            summary_sheet = workbook.add_worksheet('Summary')
+        summary_rows = []
+        json_entries = {}
+
+        save_paths = []
+        renders = []
+        try:
+            for scenario_id, results in self.iter_simulations(distribution=distribution,
+                                                              parallel=parallel):
+                if save_dir:
+                    save_path = analysis_plot_path(save_dir, scenario_id)
+                    if render_executor is not None:
+                        renders.append(render_executor.submit(_render_scenario_figure,
+                                                              self._render_payload(results),
+                                                              save_path))
+                    else:
+                        _render_scenario_figure(results, save_path)
+                    save_paths.append(save_path)
+
+                if excel_filename:
+                    summary_rows.append(self._summary_row(results))
+                    if workbook is not None:
+                        if len(summary_rows) == 1:
+                            summary_sheet.write_row(0, 0, list(summary_rows[0]), header_format)
+                        summary_sheet.write_row(len(summary_rows), 0,
+                                                list(summary_rows[-1].values()))
+
+                    if workbook is not None and 'ale_samples' in results:
+                        # Excel sheet name limit
+                        worksheet = workbook.add_worksheet(f'Sim_{scenario_id}'[:31])
+                        columns = [column for column, _ in self.SIMULATION_SHEET_COLUMNS]
+                        worksheet.write_row(0, 0, ['Iteration'] + columns, header_format)
+                        for row_num, row in enumerate(self._simulation_sheet_rows(results), 1):
+                            worksheet.write_row(row_num, 0, row)
+
+                if json_filename:
+                    json_entries[scenario_id] = self._json_result_entry(results)
+
+            for render in renders:
+                render.result()  # Re-raise any rendering error
+
+            if workbook is not None:
+                scenarios_df = self._scenario_definitions()
+                worksheet = workbook.add_worksheet('Scenarios')
+                worksheet.write_row(0, 0, list(scenarios_df.columns), header_format)
+                for row_num, row in enumerate(scenarios_df.itertuples(index=False), 1):
+                    worksheet.write_row(row_num, 0, row)
+        finally:
+            if workbook is not None:
+                workbook.close()
+            if render_executor is not None:
+                render_executor.shutdown()
+
+        if excel_filename:
+            if workbook is None:
+                import pandas as pd
+                self._write_excel(excel_filename, pd.DataFrame(summary_rows))
+            print(f"Results exported to {excel_filename}")
+        if json_filename:
+            self._write_json(json_filename, json_entries)
+            print(f"Results exported to {json_filename}")
+
+        return save_paths
+
     def create_comparison_chart(self, save_path: Optional[str] = None) -> None:
         """
         Create comparison chart for all scenarios
@@ -535,6 +1617,23 @@ class FAIRRiskCalculator:
             mean_losses.append(results['statistics']['mean_loss'])
             percentile_90s.append(results['statistics']['percentile_90'])
             percentile_95s.append(results['statistics']['var_95'])
+
+        # Fingerprint the plotted data to detect an unchanged, already saved chart
+        digest = hashlib.blake2b(
+            "|".join(map(str, scenarios)).encode() +
+            np.array([mean_losses, percentile_90s, percentile_95s], dtype=float).tobytes(),
+            digest_size=16
+        ).hexdigest()
+        already_saved = (save_path is not None and self._saved_comparison == (save_path, digest)
+                         and os.path.exists(save_path))
+
+        import matplotlib.pyplot as plt
+        from matplotlib.ticker import FuncFormatter
+
+        # With a non-GUI backend nothing would be displayed, so skip rendering entirely
+        if already_saved and plt.get_backend().lower() == 'agg':
+            print(f"Comparison chart unchanged: {save_path}")
+            return
         
         # Create comparison chart
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
@@ -560,7 +1659,7 @@ class FAIRRiskCalculator:
         for bars in [bars1, bars2, bars3]:
             for bar in bars:
                 height = bar.get_height()
-                ax1.annotate(f'${height/1e6:.1f}M' if height >= 1e6 else f'${height/1e3:.0f}K',
+                ax1.annotate(_format_money(height),
                            xy=(bar.get_x() + bar.get_width() / 2, height),
                            xytext=(0, 3),
                            textcoords="offset points",
@@ -577,74 +1676,246 @@ class FAIRRiskCalculator:
         ax2.grid(True, alpha=0.3)
         
         # Format axes
-        ax2.ticklabel_format(style='plain', axis='both')
-        ax2.set_xticklabels([f'${x/1e6:.1f}M' if x >= 1e6 else f'${x/1e3:.0f}K' for x in ax2.get_xticks()])
-        ax2.set_yticklabels([f'${y/1e6:.1f}M' if y >= 1e6 else f'${y/1e3:.0f}K' for y in ax2.get_yticks()])
+        ax2.xaxis.set_major_formatter(FuncFormatter(_format_money))
+        ax2.yaxis.set_major_formatter(FuncFormatter(_format_money))
         
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Comparison chart saved to {save_path}")
+            if already_saved:
+                print(f"Comparison chart unchanged: {save_path}")
+            else:
+                plt.savefig(save_path, dpi=300, bbox_inches='tight')
+                self._saved_comparison = (save_path, digest)
+                print(f"Comparison chart saved to {save_path}")
         
         plt.show()
     
-    def export_to_excel(self, filename: str) -> None:
+    def _scenario_definitions(self) -> 'pd.DataFrame':
+        """
+        Build the scenario input table used by the Excel export
+
+        Returns:
+            DataFrame with one row per scenario
+        """
+        import pandas as pd
+
+        return pd.DataFrame([{
+            'Scenario ID': s['id'],
+            'Description': s['description'],
+            'TEF Low': s['tef']['low'],
+            'TEF Medium': s['tef']['medium'],
+            'TEF High': s['tef']['high'],
+            'Vuln Low': s['vulnerability']['low'],
+            'Vuln Medium': s['vulnerability']['medium'],
+            'Vuln High': s['vulnerability']['high'],
+            'Loss Low': s['loss_magnitude']['low'],
+            'Loss Medium': s['loss_magnitude']['medium'],
+            'Loss High': s['loss_magnitude']['high'],
+            'Asset': s['asset'],
+            'Threat Actor': s['threat_actor'],
+            'Loss Effect': s['loss_effect'],
+            'Notes': s['notes']
+        } for s in self.scenarios])
+
+    # Columns of the per-scenario simulation sheets, paired with their result keys
+    SIMULATION_SHEET_COLUMNS = [
+        ('TEF', 'tef_samples'),
+        ('Vulnerability', 'vuln_samples'),
+        ('Loss Magnitude', 'loss_samples'),
+        ('LEF', 'lef_samples'),
+        ('Annual Loss', 'ale_samples'),
+    ]
+
+    def export_to_excel(self, filename: str, distribution: Optional[str] = None) -> None:
         """
         Export all results to an Excel file with multiple sheets
+
+        With xlsxwriter installed the workbook is written in constant-memory
+        mode, streaming each row to disk, so memory use does not grow with
+        the number of iterations. Otherwise openpyxl's write-only mode is used.
+        Scenarios that have already been simulated are exported as they are
+        rather than re-simulated (see run_all_scenarios()).
         
         Args:
             filename: Output Excel filename
+            distribution: Distribution for the Summary sheet (default: None = the
+                          one the existing results share, else 'pert')
         """
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Summary sheet
-            summary_df = self.run_all_scenarios()
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Detailed results for each scenario
-            for scenario_id, results in self.simulation_results.items():
-                # Create detailed dataframe
-                detailed_df = pd.DataFrame({
-                    'Iteration': range(1, len(results['ale_samples']) + 1),
-                    'TEF': results['tef_samples'],
-                    'Vulnerability': results['vuln_samples'],
-                    'Loss Magnitude': results['loss_samples'],
-                    'LEF': results['lef_samples'],
-                    'Annual Loss': results['ale_samples']
-                })
-                
-                sheet_name = f'Sim_{scenario_id}'[:31]  # Excel sheet name limit
-                detailed_df.to_excel(writer, sheet_name=sheet_name, index=False)
-            
-            # Scenario definitions
-            scenarios_df = pd.DataFrame([{
-                'Scenario ID': s['id'],
-                'Description': s['description'],
-                'TEF Low': s['tef']['low'],
-                'TEF Medium': s['tef']['medium'],
-                'TEF High': s['tef']['high'],
-                'Vuln Low': s['vulnerability']['low'],
-                'Vuln Medium': s['vulnerability']['medium'],
-                'Vuln High': s['vulnerability']['high'],
-                'Loss Low': s['loss_magnitude']['low'],
-                'Loss Medium': s['loss_magnitude']['medium'],
-                'Loss High': s['loss_magnitude']['high'],
-                'Asset': s['asset'],
-                'Threat Actor': s['threat_actor'],
-                'Loss Effect': s['loss_effect'],
-                'Notes': s['notes']
-            } for s in self.scenarios])
-            scenarios_df.to_excel(writer, sheet_name='Scenarios', index=False)
+        if distribution is None:
+            distributions = {result['distribution_type']
+                             for result in self.simulation_results.values()}
+            distribution = distributions.pop() if len(distributions) == 1 else 'pert'
+
+        # Summary sheet
+        self._write_excel(filename, self.run_all_scenarios(distribution))
         
         print(f"Results exported to {filename}")
+
+    def _write_excel(self, filename: str, summary_df: 'pd.DataFrame') -> None:
+        """
+        Write the Excel export for the current simulation results
+
+        Args:
+            filename: Output Excel filename
+            summary_df: Summary table for the Summary sheet
+        """
+        scenarios_df = self._scenario_definitions()
+
+        if XLSXWRITER_AVAILABLE:
+            self._write_excel_streaming(filename, summary_df, scenarios_df)
+        else:
+            self._write_excel_write_only(filename, summary_df, scenarios_df)
+
+    def _excel_sheets(self, summary_df: 'pd.DataFrame', scenarios_df: 'pd.DataFrame',
+                      chunk_size: int = 10000) -> Iterator[Tuple[str, List[str], Iterator]]:
+        """
+        Yield each sheet of the Excel export in workbook order
+
+        Args:
+            summary_df: Summary table from run_all_scenarios()
+            scenarios_df: Scenario definitions table
+            chunk_size: Number of simulation rows converted to Python values at a time
+
+        Yields:
+            (sheet_name, column_headers, rows) tuples
+        """
+        yield 'Summary', list(summary_df.columns), summary_df.itertuples(index=False)
+
+        # Detailed results for each scenario (if its samples were kept)
+        columns = ['Iteration'] + [column for column, _ in self.SIMULATION_SHEET_COLUMNS]
+        for scenario_id, results in self.simulation_results.items():
+            if 'ale_samples' not in results:
+                continue
+            sheet_name = f'Sim_{scenario_id}'[:31]  # Excel sheet name limit
+            yield sheet_name, columns, self._simulation_sheet_rows(results, chunk_size)
+
+        # Scenario definitions
+        yield 'Scenarios', list(scenarios_df.columns), scenarios_df.itertuples(index=False)
+
+    def _write_excel_streaming(self, filename: str, summary_df: 'pd.DataFrame',
+                               scenarios_df: 'pd.DataFrame', chunk_size: int = 10000) -> None:
+        """
+        Write the Excel export row by row with xlsxwriter's constant-memory mode
+
+        Constant-memory mode only keeps the current row in memory, so rows must
+        be written strictly in order - which is why this bypasses
+        DataFrame.to_excel (pandas writes column by column).
+
+        Args:
+            filename: Output Excel filename
+            summary_df: Summary table from run_all_scenarios()
+            scenarios_df: Scenario definitions table
+            chunk_size: Number of simulation rows converted to Python values at a time
+        """
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        header_format = workbook.add_format({'bold': True, 'border': 1})
+
+        try:
+            sheets = self._excel_sheets(summary_df, scenarios_df, chunk_size)
+            for sheet_name, columns, rows in sheets:
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, columns, header_format)
+                for row_num, row in enumerate(rows, 1):
+                    worksheet.write_row(row_num, 0, row)
+        finally:
+            workbook.close()
+
+    def _write_excel_write_only(self, filename: str, summary_df: 'pd.DataFrame',
+                                scenarios_df: 'pd.DataFrame', chunk_size: int = 10000) -> None:
+        """
+        Write the Excel export with openpyxl's write-only mode
+
+        Fallback for when xlsxwriter is not installed. Write-only worksheets
+        append rows straight to a temporary file instead of building a cell
+        object per value, so this streams the same way as the xlsxwriter path.
+
+        Args:
+            filename: Output Excel filename
+            summary_df: Summary table from run_all_scenarios()
+            scenarios_df: Scenario definitions table
+            chunk_size: Number of simulation rows converted to Python values at a time
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+
+        workbook = Workbook(write_only=True)
+        for sheet_name, columns, rows in self._excel_sheets(summary_df, scenarios_df, chunk_size):
+            worksheet = workbook.create_sheet(sheet_name)
+            header = []
+            for column in columns:
+                cell = WriteOnlyCell(worksheet, value=column)
+                cell.font = Font(bold=True)
+                header.append(cell)
+            worksheet.append(header)
+            for row in rows:
+                worksheet.append(list(row))
+        workbook.save(filename)
     
+    def _simulation_sheet_rows(self, results: Dict, chunk_size: int = 10000) -> Iterator[List]:
+        """
+        Yield a scenario's per-iteration rows for its Sim_ sheet
+
+        Args:
+            results: Simulation results for the scenario
+            chunk_size: Number of rows converted to Python values at a time
+
+        Yields:
+            [iteration, TEF, vulnerability, loss magnitude, ALE] rows
+        """
+        columns = [results[key] for _, key in self.SIMULATION_SHEET_COLUMNS]
+        total = len(results['ale_samples'])
+        for start in range(0, total, chunk_size):
+            stop = min(start + chunk_size, total)
+            block = np.column_stack([np.arange(start + 1, stop + 1)] +
+                                    [values[start:stop] for values in columns])
+            for row in block.tolist():
+                row[0] = int(row[0])
+                yield row
+
     def export_to_json(self, filename: str) -> None:
         """
         Export results to JSON format
+
+        Uses orjson (with native NumPy support) when installed, otherwise the
+        standard json module. Both produce the same 2-space indented layout.
         
         Args:
             filename: Output JSON filename
         """
+        self._write_json(filename, {scenario_id: self._json_result_entry(results)
+                                    for scenario_id, results in self.simulation_results.items()})
+
+        print(f"Results exported to {filename}")
+
+    @staticmethod
+    def _json_result_entry(results: Dict) -> Dict:
+        """
+        Build a scenario's entry in the JSON export's 'results' section
+
+        Args:
+            results: Simulation results for the scenario
+
+        Returns:
+            Description, statistics and distribution type (no raw samples)
+        """
+        return {
+            'description': results['description'],
+            'statistics': results['statistics'],
+            'distribution_type': results['distribution_type']
+        }
+
+    def _write_json(self, filename: str, result_entries: Dict[str, Dict]) -> None:
+        """
+        Write the JSON export document
+
+        Args:
+            filename: Output JSON filename
+            result_entries: Scenario ID -> entry from _json_result_entry()
+        """
         export_data = {
             'metadata': {
                 'generated_at': datetime.now().isoformat(),
@@ -652,20 +1923,100 @@ class FAIRRiskCalculator:
                 'total_scenarios': len(self.scenarios)
             },
             'scenarios': self.scenarios,
-            'results': {}
+            'results': result_entries
         }
         
-        for scenario_id, results in self.simulation_results.items():
-            export_data['results'][scenario_id] = {
-                'description': results['description'],
-                'statistics': results['statistics'],
-                'distribution_type': results['distribution_type']
-            }
-        
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
-        
-        print(f"Results exported to {filename}")
+        if ORJSON_AVAILABLE:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(export_data, default=str,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(export_data, f, indent=2, default=str)
+
+
+# Per-process figure reused by _render_scenario_figure()
+_WORKER_FIGURE = None
+
+
+def _render_scenario_figure(results: Dict, save_path: str) -> str:
+    """
+    Render and save one scenario's analysis figure in a worker process
+
+    Args:
+        results: Simulation results for the scenario, usually with the
+                 sample arrays replaced by a 'sample_summary'
+        save_path: Path to save the figure to
+
+    Returns:
+        The save path
+    """
+    global _WORKER_FIGURE
+    if _WORKER_FIGURE is None:
+        from matplotlib.figure import Figure
+        _WORKER_FIGURE = Figure(figsize=(16, 10))
+
+    calculator = FAIRRiskCalculator()
+    calculator.simulation_results[results['scenario_id']] = results
+    calculator.create_visualizations(results['scenario_id'], save_path, fig=_WORKER_FIGURE)
+    return save_path
+
+
+def analysis_plot_path(save_dir: str, scenario_id: str) -> str:
+    """
+    Path of a scenario's saved analysis figure
+
+    Args:
+        save_dir: Directory plots are saved in
+        scenario_id: ID of the scenario
+
+    Returns:
+        File path for the figure
+    """
+    return f"{save_dir}/{scenario_id}_analysis.png"
+
+
+def _simulate_scenario(scenario: Dict, iterations: int, distribution: str, seed: int,
+                       shm_name: str, row: int, sample_dtype: str = 'float64') -> Tuple[str, Dict]:
+    """
+    Simulate a single scenario in a worker process
+
+    The sample arrays are written into row ``row`` of the parent's shared
+    memory block (laid out as in FAIRRiskCalculator.iter_simulations) and
+    left out of the returned results, so they are not pickled.
+
+    Args:
+        scenario: Scenario dictionary as stored in FAIRRiskCalculator.scenarios
+        iterations: Number of Monte Carlo iterations
+        distribution: Type of distribution ('pert' or 'triangular')
+        seed: Random seed for this scenario
+        shm_name: Name of the shared memory block to write samples into
+        row: This scenario's index in the shared memory block
+        sample_dtype: dtype of the samples, and of the shared memory block
+
+    Returns:
+        Tuple of (scenario_id, results without the sample arrays)
+    """
+    calculator = FAIRRiskCalculator(iterations=iterations, random_seed=seed,
+                                    sample_dtype=sample_dtype)
+    calculator.scenarios.append(scenario)
+    calculator._scenarios_by_id[scenario['id']] = scenario
+    results = calculator.run_simulation(scenario['id'], distribution)
+
+    from multiprocessing import shared_memory
+
+    sample_keys = [key for _, key in FAIRRiskCalculator.SIMULATION_SHEET_COLUMNS]
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        dtype = np.dtype(sample_dtype)
+        samples = np.ndarray((len(sample_keys), iterations), dtype=dtype, buffer=shm.buf,
+                             offset=row * len(sample_keys) * iterations * dtype.itemsize)
+        for k, key in enumerate(sample_keys):
+            samples[k] = results.pop(key)
+        del samples
+    finally:
+        shm.close()
+    return scenario['id'], results
 
 
 def get_user_input(prompt, input_type=str, min_val=None, max_val=None, default=None):
@@ -777,6 +2128,26 @@ def interactive_scenario_builder():
     }
 
 
+def select_result(calculator, heading, prompt):
+    """
+    List simulated scenarios and ask the user to pick one
+
+    The scenario IDs are collected while the list is printed, so the
+    selection is a plain list lookup with no second pass over the results.
+
+    Returns:
+        The selected scenario ID
+    """
+    print(f"\n{heading}")
+    result_ids = []
+    for i, (sid, data) in enumerate(calculator.simulation_results.items(), 1):
+        print(f"  {i}. {sid} - {data['description']}")
+        result_ids.append(sid)
+
+    scenario_num = get_user_input(f"\n{prompt}", int, 1, len(result_ids))
+    return result_ids[scenario_num - 1]
+
+
 def display_results(results):
     """
     Display simulation results in a formatted way
@@ -814,6 +2185,189 @@ def display_results(results):
     print("\n" + "="*60)
 
 
+def _menu_add_scenario(calculator, args):
+    """Menu option 1: add a new risk scenario"""
+    scenario_data = interactive_scenario_builder()
+    calculator.add_scenario(**scenario_data)
+    print(f"\n✓ Scenario '{scenario_data['description']}' added successfully!")
+    print(f"Total scenarios: {len(calculator.scenarios)}")
+
+
+def _menu_run_simulations(calculator, args):
+    """Menu option 2: run simulations for all scenarios"""
+    if not calculator.scenarios:
+        print("\n⚠️ No scenarios to simulate. Please add scenarios first.")
+    else:
+        # Unchanged scenarios reuse their earlier results unless a re-run is forced
+        use_cache = True
+        if calculator.simulation_results:
+            force = get_user_input("Force re-run of already simulated scenarios? (y/n)",
+                                   default="n")
+            use_cache = force.lower() != 'y'
+
+        print(f"\n🎲 Running simulations for {len(calculator.scenarios)} scenarios...")
+        completed = calculator.iter_simulations(distribution=args.distribution,
+                                                parallel=not args.no_parallel,
+                                                use_cache=use_cache)
+        if TQDM_AVAILABLE:
+            for _ in tqdm(completed, total=len(calculator.scenarios),
+                          desc="Simulating", unit="scenario"):
+                pass
+        else:
+            # Flush progress lines at most every 0.25s instead of once per scenario
+            previous_results = dict(calculator.simulation_results)
+            progress_lines = []
+            last_flush = time.monotonic()
+            for sid, results in completed:
+                status = "Reused" if previous_results.get(sid) is results else "Simulated"
+                progress_lines.append(f"  - {status}: {sid} - {results['description']}\n")
+                if time.monotonic() - last_flush >= 0.25:
+                    sys.stdout.write(''.join(progress_lines))
+                    sys.stdout.flush()
+                    progress_lines.clear()
+                    last_flush = time.monotonic()
+            sys.stdout.write(''.join(progress_lines))
+        print("\n✓ All simulations completed!")
+
+
+def _menu_view_results(calculator, args):
+    """Menu option 3: display one scenario's results"""
+    if not calculator.simulation_results:
+        print("\n⚠️ No results available. Please run simulations first.")
+    else:
+        selected_id = select_result(calculator, "Available results:",
+                                    "Select scenario number to view")
+        display_results(calculator.simulation_results[selected_id])
+
+
+def _menu_visualize(calculator, args):
+    """Menu option 4: generate visualizations"""
+    if not calculator.simulation_results:
+        print("\n⚠️ No results to visualize. Please run simulations first.")
+    else:
+        print("\nVisualization options:")
+        print("  1. Individual scenario analysis")
+        print("  2. All scenarios")
+
+        viz_choice = get_user_input("Select option (1-2)", default="1")
+
+        if viz_choice == "1":
+            selected_id = select_result(calculator, "Available scenarios:",
+                                        "Select scenario number")
+
+            save_path = None
+            if args.save_plots:
+                save_path = analysis_plot_path(args.save_plots, selected_id)
+            calculator.create_visualizations(selected_id, save_path)
+
+        else:
+            print("\n📊 Generating visualizations for all scenarios...")
+            if args.save_plots:
+                # Saving only - render off-screen, in parallel unless disabled
+                calculator.save_all_visualizations(args.save_plots,
+                                                   parallel=not args.no_parallel)
+            else:
+                for sid in calculator.simulation_results.keys():
+                    calculator.create_visualizations(sid)
+
+
+def _menu_compare(calculator, args):
+    """Menu option 5: compare scenarios"""
+    if len(calculator.simulation_results) < 2:
+        print("\n⚠️ Need at least 2 scenarios for comparison. Please add and run more scenarios.")
+    else:
+        print("\n📊 Generating scenario comparison...")
+        # Unchanged scenarios reuse the results from option 2 instead of re-simulating
+        summary = calculator.run_all_scenarios(distribution=args.distribution,
+                                               parallel=not args.no_parallel)
+        print("\n" + "="*80)
+        print("SCENARIO COMPARISON")
+        print("="*80)
+        print(summary.to_string())
+
+        if args.save_plots:
+            comparison_path = f"{args.save_plots}/scenario_comparison.png"
+        else:
+            comparison_path = None
+        calculator.create_comparison_chart(comparison_path)
+
+
+def _menu_export(calculator, args):
+    """Menu option 6: export results"""
+    if not calculator.simulation_results:
+        print("\n⚠️ No results to export. Please run simulations first.")
+    else:
+        export_choice = get_user_input("\nExport format (excel/json/both)", default="excel")
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+
+        if export_choice in ["excel", "both"]:
+            filename = args.export_excel or f"risk_analysis_{timestamp}.xlsx"
+            calculator.export_to_excel(filename)
+            print(f"✓ Exported to Excel: {filename}")
+
+        if export_choice in ["json", "both"]:
+            filename = args.export_json or f"risk_analysis_{timestamp}.json"
+            calculator.export_to_json(filename)
+            print(f"✓ Exported to JSON: {filename}")
+
+
+def _menu_exit(calculator, args):
+    """Menu option 7: exit"""
+    print("\nThank you for using FAIR Risk Calculator!")
+    return True
+
+
+# Interactive menu choice -> handler(calculator, args); a True return leaves the menu
+MENU_HANDLERS = {
+    "1": _menu_add_scenario,
+    "2": _menu_run_simulations,
+    "3": _menu_view_results,
+    "4": _menu_visualize,
+    "5": _menu_compare,
+    "6": _menu_export,
+    "7": _menu_exit,
+}
+
+
+def dry_run(calculator, args) -> bool:
+    """
+    Report what a run would write without simulating (--dry-run)
+
+    Batch scenarios have already been validated by add_scenario(); this
+    resolves every plot and export path and checks its directory is writable.
+
+    Args:
+        calculator: Calculator holding the loaded scenarios
+        args: Parsed command-line arguments
+
+    Returns:
+        True if every output path can be written
+    """
+    outputs = []
+    if args.save_plots:
+        outputs.extend(analysis_plot_path(args.save_plots, scenario['id'])
+                       for scenario in calculator.scenarios)
+        if not args.batch:
+            outputs.append(f"{args.save_plots}/scenario_comparison.png")
+    if args.export_excel:
+        outputs.append(args.export_excel)
+    if args.export_json:
+        outputs.append(args.export_json)
+
+    print(f"DRY RUN - {len(calculator.scenarios)} scenario(s) validated, nothing simulated")
+    if not outputs:
+        print("  No output paths configured")
+
+    all_writable = True
+    for path in outputs:
+        directory = os.path.dirname(path) or '.'
+        writable = os.path.isdir(directory) and os.access(directory, os.W_OK)
+        all_writable = all_writable and writable
+        print(f"  {'✓' if writable else '✗ not writable:'} {path}")
+
+    return all_writable
+
+
 def main():
     """
     Main function with interactive mode
@@ -821,16 +2375,31 @@ def main():
     parser = argparse.ArgumentParser(description='FAIR Risk Calculator - Interactive Risk Assessment Tool')
     parser.add_argument('--iterations', type=int, default=10000,
                        help='Number of Monte Carlo iterations (default: 10000)')
-    parser.add_argument('--distribution', choices=['pert', 'uniform'], default='pert',
+    parser.add_argument('--distribution', choices=['pert', 'triangular'], default='pert',
                        help='Distribution type (default: pert)')
     parser.add_argument('--export-excel', type=str, help='Export results to Excel file')
     parser.add_argument('--export-json', type=str, help='Export results to JSON file')
     parser.add_argument('--save-plots', type=str, help='Save plots to specified directory')
     parser.add_argument('--batch', type=str, help='Load scenarios from JSON file for batch processing')
     parser.add_argument('--quick', action='store_true', help='Quick mode - single scenario analysis')
+    parser.add_argument('--no-parallel', action='store_true',
+                        help='Simulate scenarios sequentially in a single process (for debugging)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Validate scenarios and output paths, then exit without simulating')
+    parser.add_argument('--warmup', action='store_true',
+                        help='Compile the optional Numba kernels into their on-disk cache, '
+                             'then exit')
     
     args = parser.parse_args()
 
+    if args.warmup:
+        if NUMBA_AVAILABLE:
+            _lef_ale_kernel()
+            print("✓ Numba kernels compiled and cached")
+        else:
+            print("Numba is not installed - nothing to compile")
+        sys.exit(0)
+
     # Auto-integrity check (runs automatically on first and subsequent runs)
     if AUTO_INTEGRITY_AVAILABLE:
         if not ensure_integrity(auto_generate=True, strict=False, silent=False):
@@ -853,13 +2422,28 @@ def main():
                 scenarios = batch_data.get('scenarios', [])
                 
             print(f"Loading {len(scenarios)} scenarios from {args.batch}...")
+            calculator.add_scenarios(scenarios)
             for scenario in scenarios:
-                calculator.add_scenario(**scenario)
                 print(f"  ✓ Loaded: {scenario['scenario_id']} - {scenario['description']}")
             
         except Exception as e:
             print(f"Error loading batch file: {e}")
+            if args.dry_run:
+                sys.exit(1)
             return
+
+    if args.dry_run:
+        sys.exit(0 if dry_run(calculator, args) else 1)
+
+    if args.batch:
+        print(f"\n🎲 Running simulations for {len(calculator.scenarios)} scenarios...")
+        # Plots and exports are produced per scenario as each simulation finishes
+        calculator.simulate_and_export(save_dir=args.save_plots,
+                                       excel_filename=args.export_excel,
+                                       json_filename=args.export_json,
+                                       distribution=args.distribution,
+                                       parallel=not args.no_parallel)
+        print("✓ All simulations completed!")
     
     elif args.quick:
         # Quick mode - single scenario
@@ -875,16 +2459,14 @@ def main():
         
         # Ask if user wants visualization
         if get_user_input("\nGenerate visualization? (y/n)", default="y").lower() == 'y':
+            scenario_id = scenario_data['scenario_id']
+            save_path = None
             if args.save_plots:
-                save_path = f"{args.save_plots}/{scenario_data['scenario_id']}_analysis.png"
-            else:
-                save_path = None
-            calculator.create_visualizations(scenario_data['scenario_id'], save_path)
+                save_path = analysis_plot_path(args.save_plots, scenario_id)
+            calculator.create_visualizations(scenario_id, save_path)
     
     else:
         # Full interactive mode - multiple scenarios
-        scenarios_added = 0
-        
         while True:
             print("\n" + "-"*60)
             print("OPTIONS:")
@@ -899,117 +2481,14 @@ def main():
             
             choice = get_user_input("Select option (1-7)", default="1")
             
-            if choice == "1":
-                # Add new scenario
-                scenario_data = interactive_scenario_builder()
-                calculator.add_scenario(**scenario_data)
-                scenarios_added += 1
-                print(f"\n✓ Scenario '{scenario_data['description']}' added successfully!")
-                print(f"Total scenarios: {scenarios_added}")
-            
-            elif choice == "2":
-                # Run simulations
-                if not calculator.scenarios:
-                    print("\n⚠️ No scenarios to simulate. Please add scenarios first.")
-                else:
-                    print(f"\n🎲 Running simulations for {len(calculator.scenarios)} scenarios...")
-                    for scenario in calculator.scenarios:
-                        print(f"  - Simulating: {scenario['id']} - {scenario['description']}")
-                        calculator.run_simulation(scenario['id'], distribution=args.distribution)
-                    print("\n✓ All simulations completed!")
-            
-            elif choice == "3":
-                # View results
-                if not calculator.simulation_results:
-                    print("\n⚠️ No results available. Please run simulations first.")
-                else:
-                    print("\nAvailable results:")
-                    for i, (sid, data) in enumerate(calculator.simulation_results.items(), 1):
-                        print(f"  {i}. {sid} - {data['description']}")
-                    
-                    scenario_num = get_user_input("\nSelect scenario number to view", int, 1, len(calculator.simulation_results))
-                    selected_id = list(calculator.simulation_results.keys())[scenario_num - 1]
-                    display_results(calculator.simulation_results[selected_id])
-            
-            elif choice == "4":
-                # Generate visualizations
-                if not calculator.simulation_results:
-                    print("\n⚠️ No results to visualize. Please run simulations first.")
-                else:
-                    print("\nVisualization options:")
-                    print("  1. Individual scenario analysis")
-                    print("  2. All scenarios")
-                    
-                    viz_choice = get_user_input("Select option (1-2)", default="1")
-                    
-                    if viz_choice == "1":
-                        print("\nAvailable scenarios:")
-                        for i, (sid, data) in enumerate(calculator.simulation_results.items(), 1):
-                            print(f"  {i}. {sid} - {data['description']}")
-                        
-                        scenario_num = get_user_input("\nSelect scenario number", int, 1, len(calculator.simulation_results))
-                        selected_id = list(calculator.simulation_results.keys())[scenario_num - 1]
-                        
-                        if args.save_plots:
-                            save_path = f"{args.save_plots}/{selected_id}_analysis.png"
-                        else:
-                            save_path = None
-                        
-                        calculator.create_visualizations(selected_id, save_path)
-                    
-                    else:
-                        print("\n📊 Generating visualizations for all scenarios...")
-                        for sid in calculator.simulation_results.keys():
-                            if args.save_plots:
-                                save_path = f"{args.save_plots}/{sid}_analysis.png"
-                            else:
-                                save_path = None
-                            calculator.create_visualizations(sid, save_path)
-            
-            elif choice == "5":
-                # Compare scenarios
-                if len(calculator.simulation_results) < 2:
-                    print("\n⚠️ Need at least 2 scenarios for comparison. Please add and run more scenarios.")
-                else:
-                    print("\n📊 Generating scenario comparison...")
-                    summary = calculator.run_all_scenarios()
-                    print("\n" + "="*80)
-                    print("SCENARIO COMPARISON")
-                    print("="*80)
-                    print(summary.to_string())
-                    
-                    if args.save_plots:
-                        comparison_path = f"{args.save_plots}/scenario_comparison.png"
-                    else:
-                        comparison_path = None
-                    calculator.create_comparison_chart(comparison_path)
-            
-            elif choice == "6":
-                # Export results
-                if not calculator.simulation_results:
-                    print("\n⚠️ No results to export. Please run simulations first.")
-                else:
-                    export_choice = get_user_input("\nExport format (excel/json/both)", default="excel")
-                    
-                    if export_choice in ["excel", "both"]:
-                        filename = args.export_excel or f"risk_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-                        calculator.export_to_excel(filename)
-                        print(f"✓ Exported to Excel: {filename}")
-                    
-                    if export_choice in ["json", "both"]:
-                        filename = args.export_json or f"risk_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                        calculator.export_to_json(filename)
-                        print(f"✓ Exported to JSON: {filename}")
-            
-            elif choice == "7":
-                print("\nThank you for using FAIR Risk Calculator!")
-                break
-            
-            else:
+            handler = MENU_HANDLERS.get(choice)
+            if handler is None:
                 print("\n⚠️ Invalid option. Please select 1-7.")
+            elif handler(calculator, args):
+                break
     
-    # Final export if specified
-    if calculator.simulation_results:
+    # Final export if specified (batch mode exports during the simulation pass)
+    if calculator.simulation_results and not args.batch:
         if args.export_excel and not args.quick:
             calculator.export_to_excel(args.export_excel)
         if args.export_json and not args.quick:
@@ -2,22 +2,26 @@
 """
 FAIR Risk Calculator - Integrity Manifest Generator
 
-This script generates cryptographic hashes (SHA-256) of all critical files
-to create an integrity baseline. The manifest can be used to detect unauthorized
-modifications to the codebase.
+This script generates cryptographic hashes (SHA-256, or BLAKE3 when requested)
+of all critical files to create an integrity baseline. The manifest can be used
+to detect unauthorized modifications to the codebase.
 
 Usage:
-    python generate_integrity_manifest.py
+    python generate_integrity_manifest.py [--fast]
+
+    --fast  Hash with BLAKE3 instead of SHA-256 (needs the blake3 package)
 
 Output:
     integrity_manifest.json - Contains SHA-256 hashes of all critical files
 """
 
-import hashlib
 import json
 import os
+import sys
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from integrity_checker import BLAKE3_AVAILABLE, file_stat_key, hash_file, new_hasher
 
 
 class IntegrityManifestGenerator:
@@ -40,18 +44,27 @@ class IntegrityManifestGenerator:
         'docker-compose.yml',
     ]
 
-    def __init__(self, base_dir: str = '.'):
+    def __init__(self, base_dir: str = '.', algorithm: str = 'SHA-256', silent: bool = False):
         """
         Initialize the manifest generator
 
         Args:
             base_dir: Base directory of the project (default: current directory)
+            algorithm: Hash algorithm, 'SHA-256' or 'BLAKE3' (default: SHA-256)
+            silent: If True, suppress progress output (errors still shown)
         """
+        new_hasher(algorithm)  # Validate algorithm up front
         self.base_dir = base_dir
+        self.algorithm = algorithm
+        self.silent = silent
+
+        # Hashes by (device, inode, size, mtime_ns, ctime_ns), so a file is
+        # only re-hashed by this generator once it has changed
+        self._hash_cache = {}
         self.manifest = {
-            'version': '1.0',
+            'version': '1.1',
             'generated_at': None,
-            'algorithm': 'SHA-256',
+            'algorithm': algorithm,
             'files': {},
             'metadata': {
                 'generator': 'FAIR Risk Calculator Integrity System',
@@ -59,24 +72,29 @@ class IntegrityManifestGenerator:
             }
         }
 
-    def calculate_file_hash(self, file_path: str) -> str:
+    def calculate_file_hash(self, file_path: str,
+                            file_stat: Optional[os.stat_result] = None) -> str:
         """
-        Calculate SHA-256 hash of a file
+        Calculate the hash of a file using the configured algorithm
+
+        Results are memoized by the file's identity and stat key, so hashing
+        an unchanged file again returns the earlier result without reading it.
 
         Args:
             file_path: Path to the file
+            file_stat: The file's os.stat() result if already known
 
         Returns:
-            Hexadecimal SHA-256 hash string
+            Hexadecimal hash string
         """
-        sha256_hash = hashlib.sha256()
-
         try:
-            with open(file_path, 'rb') as f:
-                # Read file in chunks to handle large files efficiently
-                for byte_block in iter(lambda: f.read(4096), b''):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+            if file_stat is None:
+                file_stat = os.stat(file_path)
+            key = (file_stat.st_dev, file_stat.st_ino, *file_stat_key(file_stat))
+            file_hash = self._hash_cache.get(key)
+            if file_hash is None:
+                file_hash = self._hash_cache[key] = hash_file(file_path, self.algorithm)
+            return file_hash
         except FileNotFoundError:
             return None
         except Exception as e:
@@ -95,7 +113,10 @@ class IntegrityManifestGenerator:
         """
         full_path = os.path.join(self.base_dir, file_path)
 
-        if not os.path.exists(full_path):
+        # One stat serves as both the existence check and the size/mtime source
+        try:
+            file_stat = os.stat(full_path)
+        except FileNotFoundError:
             return {
                 'status': 'missing',
                 'hash': None,
@@ -103,8 +124,7 @@ class IntegrityManifestGenerator:
                 'modified': None
             }
 
-        file_hash = self.calculate_file_hash(full_path)
-        file_stat = os.stat(full_path)
+        file_hash = self.calculate_file_hash(full_path, file_stat)
 
         return {
             'status': 'present',
@@ -114,6 +134,28 @@ class IntegrityManifestGenerator:
             'path': file_path
         }
 
+    def get_file_infos(self, file_paths: List[str]) -> Dict[str, Dict]:
+        """
+        Get detailed information about several files, hashing them concurrently
+
+        hashlib releases the GIL while hashing, so all the files are hashed in
+        one thread pool rather than one after another.
+
+        Args:
+            file_paths: Paths of the files, relative to base_dir
+
+        Returns:
+            Dictionary mapping each path to its get_file_info() result
+        """
+        workers = min(8, os.cpu_count() or 1, len(file_paths))
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return dict(zip(file_paths, executor.map(self.get_file_info, file_paths)))
+
+        return {file_path: self.get_file_info(file_path) for file_path in file_paths}
+
     def generate_manifest(self, include_additional: bool = True) -> Dict:
         """
         Generate complete integrity manifest
@@ -126,27 +168,38 @@ class IntegrityManifestGenerator:
         """
         self.manifest['generated_at'] = datetime.now().isoformat()
 
+        # Hash every file in one batch, then report them in order
+        file_paths = list(self.CRITICAL_FILES)
+        if include_additional:
+            file_paths += self.ADDITIONAL_FILES
+        file_infos = self.get_file_infos(file_paths)
+
         # Process critical files
-        print("Generating integrity manifest...")
-        print("\nCritical Files:")
+        if not self.silent:
+            print("Generating integrity manifest...")
+            print("\nCritical Files:")
         for file_path in self.CRITICAL_FILES:
-            file_info = self.get_file_info(file_path)
+            file_info = file_infos[file_path]
             self.manifest['files'][file_path] = file_info
 
-            status_icon = "✅" if file_info['status'] == 'present' else "❌"
-            print(f"  {status_icon} {file_path}")
-            if file_info['hash']:
-                print(f"     SHA-256: {file_info['hash'][:16]}...{file_info['hash'][-16:]}")
+            if not self.silent:
+                status_icon = "✅" if file_info['status'] == 'present' else "❌"
+                print(f"  {status_icon} {file_path}")
+                if file_info['hash']:
+                    file_hash = file_info['hash']
+                    print(f"     {self.algorithm}: {file_hash[:16]}...{file_hash[-16:]}")
 
         # Process additional files if requested
         if include_additional:
-            print("\nAdditional Files:")
+            if not self.silent:
+                print("\nAdditional Files:")
             for file_path in self.ADDITIONAL_FILES:
-                file_info = self.get_file_info(file_path)
+                file_info = file_infos[file_path]
                 self.manifest['files'][file_path] = file_info
 
-                status_icon = "✅" if file_info['status'] == 'present' else "❌"
-                print(f"  {status_icon} {file_path}")
+                if not self.silent:
+                    status_icon = "✅" if file_info['status'] == 'present' else "❌"
+                    print(f"  {status_icon} {file_path}")
 
         return self.manifest
 
@@ -162,9 +215,10 @@ class IntegrityManifestGenerator:
         with open(output_path, 'w') as f:
             json.dump(self.manifest, f, indent=2, sort_keys=True)
 
-        print(f"\n✅ Integrity manifest saved to: {output_file}")
-        print(f"   Total files monitored: {len(self.manifest['files'])}")
-        print(f"   Generated at: {self.manifest['generated_at']}")
+        if not self.silent:
+            print(f"\n✅ Integrity manifest saved to: {output_file}")
+            print(f"   Total files monitored: {len(self.manifest['files'])}")
+            print(f"   Generated at: {self.manifest['generated_at']}")
 
     def print_summary(self):
         """Print summary of generated manifest"""
@@ -190,8 +244,16 @@ def main():
     print("\nThis tool creates a cryptographic baseline of all critical files.")
     print("Use verify_integrity.py to check for unauthorized modifications.\n")
 
+    # --fast swaps SHA-256 for the SIMD BLAKE3 implementation when it is installed
+    algorithm = 'SHA-256'
+    if '--fast' in sys.argv:
+        if BLAKE3_AVAILABLE:
+            algorithm = 'BLAKE3'
+        else:
+            print("⚠️  --fast needs the blake3 package (pip install blake3) - using SHA-256\n")
+
     # Generate manifest
-    generator = IntegrityManifestGenerator()
+    generator = IntegrityManifestGenerator(algorithm=algorithm)
     generator.generate_manifest(include_additional=True)
     generator.save_manifest()
     generator.print_summary()
@@ -13,17 +13,175 @@ Usage:
         # Take appropriate action
 """
 
+import atexit
 import hashlib
 import json
+import mmap
 import os
 import sys
-from typing import Optional, Dict
+import weakref
+from typing import Optional, Dict, List
+
+# BLAKE3 is optional - SHA-256 is always available via hashlib
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Hash algorithms a manifest may declare in its 'algorithm' field
+SUPPORTED_ALGORITHMS = ('SHA-256', 'BLAKE3')
+
+# Read size used when hashing files (1 MiB keeps syscalls per MB low)
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Files at least this large are memory-mapped; smaller ones are read in one
+# call, which is cheaper than setting up and tearing down a mapping
+MMAP_MIN_SIZE = 1024 * 1024
+
+# Checkers with unsaved hash cache entries, saved by one exit handler. Weak,
+# so a checker is not kept alive just to flush its cache.
+_DIRTY_HASH_CACHES = weakref.WeakSet()
+
+
+def _flush_hash_caches() -> None:
+    """Save the hash cache of every live checker with unsaved entries"""
+    for checker in list(_DIRTY_HASH_CACHES):
+        checker.save_hash_cache()
+
+
+atexit.register(_flush_hash_caches)
+
+# Coarsest file timestamp resolution the stat-keyed hash caches allow for
+# (FAT's 2 s) - see is_racy()
+STAT_GRANULARITY_NS = 2 * 10**9
+
+
+def new_hasher(algorithm: str = 'SHA-256'):
+    """
+    Create a hash object for a manifest algorithm name
+
+    Args:
+        algorithm: 'SHA-256' or 'BLAKE3'
+
+    Returns:
+        Object with hashlib-style update()/hexdigest() methods
+
+    Raises:
+        ValueError: If the algorithm is unknown or BLAKE3 is not installed
+    """
+    if algorithm == 'SHA-256':
+        return hashlib.sha256()
+    if algorithm == 'BLAKE3':
+        if not BLAKE3_AVAILABLE:
+            raise ValueError("BLAKE3 manifests require the 'blake3' package (pip install blake3)")
+        return blake3.blake3()
+    raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+
+def file_stat_key(file_stat: os.stat_result) -> List[int]:
+    """
+    Stat fields that identify an unchanged file in the hash caches
+
+    Shared by the AutoIntegrity verification cache and the
+    RuntimeIntegrityChecker hash cache. ctime is included because, unlike
+    mtime, it cannot be set back after an edit.
+
+    Args:
+        file_stat: Result of os.stat() for the file
+
+    Returns:
+        [st_size, st_mtime_ns, st_ctime_ns]
+    """
+    return [file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ctime_ns]
+
+
+def is_racy(stat_key: List[int], written_ns: int) -> bool:
+    """
+    Check whether a cached stat key is too close to its cache's write to trust
+
+    A file modified again within the same timestamp tick it was cached in
+    keeps its stat key, so (as git does for its index) an entry whose mtime
+    is within STAT_GRANULARITY_NS of the cache being written is not trusted
+    and the file is re-hashed.
+
+    Args:
+        stat_key: file_stat_key() stored in the cache entry
+        written_ns: mtime of the cache file the entry was loaded from
+
+    Returns:
+        True if the entry must not be trusted
+    """
+    return stat_key[1] + STAT_GRANULARITY_NS > written_ns
+
+
+def hash_file(file_path: str, algorithm: str = 'SHA-256') -> str:
+    """
+    Hash a file's contents in large sequential reads
+
+    Files smaller than MMAP_MIN_SIZE are read in a single call. Larger files
+    are memory-mapped and hashed in a single update() call, so the hash
+    library reads straight from the page cache (no copy into Python buffers)
+    and releases the GIL once for the whole file. Large files that cannot be
+    mapped (some special files) are read instead, using hashlib.file_digest()
+    on Python 3.11+ or a loop over a single reusable buffer on older Pythons.
+    Where supported, the kernel is told a large file will be read
+    sequentially so it can read ahead.
+
+    Args:
+        file_path: Path to the file
+        algorithm: 'SHA-256' or 'BLAKE3'
+
+    Returns:
+        Hexadecimal hash string
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the algorithm is not supported
+    """
+    file_hash = new_hasher(algorithm)
+
+    with open(file_path, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            file_hash.update(f.read())
+            return file_hash.hexdigest()
+
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass  # Advisory only
+
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mapped = None  # Unmappable - read it instead
+        if mapped is not None:
+            with mapped:
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                file_hash.update(mapped)
+            return file_hash.hexdigest()
+
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, lambda: file_hash).hexdigest()
+
+        buffer = bytearray(READ_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            bytes_read = f.readinto(buffer)
+            if not bytes_read:
+                break
+            file_hash.update(view[:bytes_read])
+
+    return file_hash.hexdigest()
 
 
 class RuntimeIntegrityChecker:
     """Performs runtime integrity checks against baseline manifest"""
 
-    def __init__(self, manifest_path: str = 'integrity_manifest.json', silent: bool = False, base_dir: str = '.'):
+    def __init__(self, manifest_path: str = 'integrity_manifest.json', silent: bool = False,
+                 base_dir: str = '.', cache_name: Optional[str] = None):
         """
         Initialize runtime integrity checker
 
@@ -31,6 +189,8 @@ class RuntimeIntegrityChecker:
             manifest_path: Path to integrity manifest file
             silent: If True, suppress all output
             base_dir: Base directory for file resolution (default: current directory)
+            cache_name: Name of a hash cache sidecar in base_dir, e.g.
+                        '.integrity_hash_cache.json' (default: None = always re-hash)
         """
         # Handle absolute vs relative manifest path
         if os.path.isabs(manifest_path):
@@ -40,6 +200,54 @@ class RuntimeIntegrityChecker:
         self.base_dir = base_dir
         self.silent = silent
         self.manifest = None
+        self._files = {}  # The manifest's 'files' mapping, set by load_manifest()
+        self.algorithm = 'SHA-256'
+
+        self.cache_path = os.path.join(base_dir, cache_name) if cache_name else None
+        self._hash_cache_written_ns = 0  # mtime of the cache file, for is_racy()
+        self._hash_cache = self._load_hash_cache() if self.cache_path else {}
+        self._hash_cache_dirty = False
+
+    def _load_hash_cache(self) -> Dict[str, dict]:
+        """
+        Load the hash cache sidecar
+
+        Returns:
+            Mapping of absolute path -> {stat, algorithm, hash}, where stat is
+            the file_stat_key() the hash was computed at,
+            or an empty dict if the cache is missing or unreadable
+        """
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+                written_ns = os.fstat(f.fileno()).st_mtime_ns
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(cache, dict):
+            return {}
+        self._hash_cache_written_ns = written_ns
+        return {path: entry for path, entry in cache.items() if isinstance(entry, dict)}
+
+    def save_hash_cache(self) -> None:
+        """
+        Atomically rewrite the hash cache if it changed (best effort)
+
+        Checkers with unsaved entries are also saved once at exit, so callers
+        only need this to persist the cache before then.
+        """
+        if not self.cache_path or not self._hash_cache_dirty:
+            return
+        tmp_path = self.cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._hash_cache, f)
+            os.replace(tmp_path, self.cache_path)
+            self._hash_cache_written_ns = os.stat(self.cache_path).st_mtime_ns
+            self._hash_cache_dirty = False
+            _DIRTY_HASH_CACHES.discard(self)
+        except OSError:
+            pass
 
     def load_manifest(self) -> bool:
         """Load integrity manifest"""
@@ -50,8 +258,13 @@ class RuntimeIntegrityChecker:
             return False
 
         try:
-            with open(self.manifest_path, 'r') as f:
-                self.manifest = json.load(f)
+            # Parse the raw bytes - json.loads() detects and decodes UTF-8
+            # itself, skipping the text-mode wrapper in one read
+            with open(self.manifest_path, 'rb') as f:
+                self.manifest = json.loads(f.read())
+            self._files = self.manifest.get('files', {})
+            self.algorithm = self.manifest.get('algorithm', 'SHA-256')
+            new_hasher(self.algorithm)  # Fail early on unsupported algorithms
             return True
         except Exception as e:
             if not self.silent:
@@ -59,26 +272,50 @@ class RuntimeIntegrityChecker:
             return False
 
     def calculate_file_hash(self, file_path: str) -> Optional[str]:
-        """Calculate SHA-256 hash of a file"""
+        """
+        Calculate the hash of a file using the manifest's algorithm
+
+        With a hash cache configured, a file whose size, mtime and ctime all
+        match its cache entry is not re-read, unless the entry is racy (see
+        is_racy()). ctime is checked because it cannot be back-dated, so
+        restoring a modified file's mtime does not hide the change.
+
+        Args:
+            file_path: Path to the file (relative to base_dir unless absolute)
+
+        Returns:
+            Hexadecimal hash string, or None if the file could not be hashed
+        """
         try:
             # Resolve file path relative to base_dir if not absolute
             if not os.path.isabs(file_path):
                 file_path = os.path.join(self.base_dir, file_path)
 
-            sha256_hash = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                for byte_block in iter(lambda: f.read(4096), b''):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+            if not self.cache_path:
+                return hash_file(file_path, self.algorithm)
+
+            key = os.path.abspath(file_path)
+            entry = {'stat': file_stat_key(os.stat(file_path)), 'algorithm': self.algorithm}
+            cached = self._hash_cache.get(key)
+            if (cached is not None and all(cached.get(k) == v for k, v in entry.items())
+                    and not is_racy(entry['stat'], self._hash_cache_written_ns)):
+                return cached.get('hash')
+
+            entry['hash'] = hash_file(file_path, self.algorithm)
+            self._hash_cache[key] = entry
+            self._hash_cache_dirty = True
+            _DIRTY_HASH_CACHES.add(self)
+            return entry['hash']
         except Exception:
             return None
 
-    def verify_file(self, file_path: str) -> bool:
+    def verify_file(self, file_path: str, current_hash: Optional[str] = None) -> bool:
         """
         Verify a single file's integrity
 
         Args:
             file_path: Path to the file to verify
+            current_hash: The file's hash if already computed (default: hash it here)
 
         Returns:
             True if file is verified or not in manifest, False if tampered
@@ -87,17 +324,33 @@ class RuntimeIntegrityChecker:
             return True  # No manifest = no verification
 
         # Check if file is in manifest
-        if file_path not in self.manifest.get('files', {}):
+        expected_info = self._files.get(file_path)
+        if expected_info is None:
             return True  # File not monitored
 
-        expected_info = self.manifest['files'][file_path]
         expected_hash = expected_info.get('hash')
 
         if not expected_hash:
             return True  # No hash to verify against
 
         # Calculate current hash
-        current_hash = self.calculate_file_hash(file_path)
+        if current_hash is None:
+            current_hash = self.calculate_file_hash(file_path)
+        return self._compare_hash(file_path, expected_hash, current_hash)
+
+    def _compare_hash(self, file_path: str, expected_hash: str,
+                      current_hash: Optional[str]) -> bool:
+        """
+        Compare a computed hash with the manifest's, warning on a mismatch
+
+        Args:
+            file_path: Path of the file, for the warning
+            expected_hash: Hash recorded in the manifest
+            current_hash: The file's current hash (None if it could not be hashed)
+
+        Returns:
+            True if the hashes match, False otherwise
+        """
         if current_hash is None:
             if not self.silent:
                 print(f"⚠️  Warning: Could not verify {file_path}")
@@ -128,11 +381,49 @@ class RuntimeIntegrityChecker:
             return True
 
         if files_to_check is None:
-            files_to_check = list(self.manifest.get('files', {}).keys())
+            files_to_check = list(self._files)
+
+        return self.verify_files(files_to_check)
+
+    def verify_files(self, files_to_check: list) -> bool:
+        """
+        Verify a subset of files against the already-loaded manifest
+
+        Unlike verify_critical_files(), this does not reload the manifest,
+        so callers that have already decided which files need hashing
+        (e.g. the auto-integrity stat cache) can pass just those.
+
+        hashlib releases the GIL while hashing, so the files are hashed
+        concurrently in a thread pool; the results are then checked (and any
+        warnings printed) in the order given, without hashing any file again.
+
+        Args:
+            files_to_check: List of files to verify
+
+        Returns:
+            True if all files verified, False if any tampering detected
+        """
+        files_to_check = list(files_to_check)
+        to_hash = [file_path for file_path in files_to_check
+                   if self._files.get(file_path, {}).get('hash')]
+
+        hashes = {}
+        workers = min(8, os.cpu_count() or 1, len(to_hash))
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                hashes = dict(zip(to_hash, executor.map(self.calculate_file_hash, to_hash)))
 
         all_verified = True
         for file_path in files_to_check:
-            if not self.verify_file(file_path):
+            if file_path in hashes:
+                # Already hashed by the pool - a None result is reported, not retried
+                verified = self._compare_hash(file_path, self._files[file_path]['hash'],
+                                              hashes[file_path])
+            else:
+                verified = self.verify_file(file_path)
+            if not verified:
                 all_verified = False
 
         return all_verified
@@ -141,7 +432,8 @@ class RuntimeIntegrityChecker:
 def verify_runtime_integrity(
     files: list = None,
     strict: bool = False,
-    silent: bool = False
+    silent: bool = False,
+    cache_name: Optional[str] = None
 ) -> bool:
     """
     Convenience function to verify runtime integrity
@@ -150,6 +442,8 @@ def verify_runtime_integrity(
         files: List of specific files to check (default: critical files)
         strict: If True, exit program if tampering detected
         silent: If True, suppress warnings
+        cache_name: Hash cache sidecar name, so unchanged files are not
+                    re-hashed on every startup (default: None = always re-hash)
 
     Returns:
         True if integrity verified, False if tampering detected
@@ -159,7 +453,7 @@ def verify_runtime_integrity(
         if not verify_runtime_integrity(['fair_risk_calculator.py'], strict=True):
             sys.exit(1)
     """
-    checker = RuntimeIntegrityChecker(silent=silent)
+    checker = RuntimeIntegrityChecker(silent=silent, cache_name=cache_name)
 
     # Default critical files
     if files is None:
@@ -198,11 +492,7 @@ def generate_file_signature(file_path: str) -> Optional[str]:
         print(f"File signature: {sig}")
     """
     try:
-        sha256_hash = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for byte_block in iter(lambda: f.read(4096), b''):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return hash_file(file_path, 'SHA-256')
     except Exception as e:
         print(f"Error generating signature for {file_path}: {e}")
         return None
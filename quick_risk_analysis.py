@@ -5,12 +5,13 @@ Get immediate risk analysis results with minimal setup
 """
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime
 import sys
 import os
 
+# matplotlib is imported lazily where the figure is drawn, and pandas where
+# results are exported, so an analysis without either doesn't pay for them
+
 # Auto-integrity protection (optional - auto-generates on first run)
 try:
     # Only import if auto_integrity.py exists
@@ -31,7 +32,7 @@ class QuickRiskAnalyzer:
     """
 
     @staticmethod
-    def pert_distribution(low, medium, high, size=10000):
+    def pert_distribution(low, medium, high, size=10000, rng=None):
         """
         Generate PERT distribution samples
 
@@ -42,6 +43,7 @@ class QuickRiskAnalyzer:
             medium: Most likely value (mode)
             high: Maximum value
             size: Number of samples
+            rng: NumPy Generator to draw from (default: a fresh unseeded one)
 
         Returns:
             NumPy array of samples
@@ -49,28 +51,77 @@ class QuickRiskAnalyzer:
         Raises:
             ValueError: If medium is not between low and high
         """
-        # Validate inputs
-        if not (low <= medium <= high):
-            raise ValueError(
-                f"PERT distribution requires low ≤ medium ≤ high. "
-                f"Got: low={low}, medium={medium}, high={high}"
-            )
-
-        # Handle degenerate case
-        if high == low:
-            return np.full(size, medium)
-
-        # PERT parameters
+        if rng is None:
+            rng = np.random.default_rng()
+        return QuickRiskAnalyzer._pert_samples([(low, medium, high)], size, rng)[0]
+
+    @staticmethod
+    def _pert_samples(params, size, rng, dtype=np.float64):
+        """
+        Generate PERT samples for several distributions into one array
+
+        The rows share a single (K, size) buffer that is scaled in place, so
+        no per-distribution scaled copies are allocated. Each row is drawn
+        with a scalar-parameter Beta call in order, which consumes the random
+        stream exactly as K separate pert_distribution() calls sharing rng would.
+
+        Args:
+            params: Sequence of (low, medium, high) tuples, one per distribution
+            size: Number of samples per distribution
+            rng: NumPy Generator to draw from
+            dtype: dtype of the returned array; draws are scaled in float64
+                   before being stored
+
+        Returns:
+            NumPy array of shape (K, size)
+
+        Raises:
+            ValueError: If medium is not between low and high for any distribution
+        """
+        samples = np.empty((len(params), size), dtype=dtype)
         lambda_param = 4  # Shape parameter for moderate confidence
-        alpha = 1 + lambda_param * (medium - low) / (high - low)
-        beta = 1 + lambda_param * (high - medium) / (high - low)
 
-        # Generate and scale Beta distribution
-        samples = np.random.beta(alpha, beta, size)
-        return low + samples * (high - low)
+        for row, (low, medium, high) in enumerate(params):
+            # Validate inputs
+            if not (low <= medium <= high):
+                raise ValueError(
+                    f"PERT distribution requires low ≤ medium ≤ high. "
+                    f"Got: low={low}, medium={medium}, high={high}"
+                )
+
+            # Handle degenerate case
+            if high == low:
+                samples[row] = medium
+                continue
+
+            # Mode at an end point: the Beta is Beta(1 + lambda, 1) or its mirror,
+            # whose inverse CDF u**(1 / (1 + lambda)) is far cheaper than rng.beta
+            if medium == high or medium == low:
+                draw = rng.random(size)
+                draw **= 1 / (1 + lambda_param)
+                if medium == high:
+                    draw *= high - low
+                    draw += low
+                else:
+                    draw *= low - high
+                    draw += high
+                samples[row] = draw
+                continue
+
+            # PERT parameters
+            alpha = 1 + lambda_param * (medium - low) / (high - low)
+            beta = 1 + lambda_param * (high - medium) / (high - low)
+
+            # Generate and scale Beta distribution in place
+            draw = rng.beta(alpha, beta, size)
+            draw *= high - low
+            draw += low
+            samples[row] = draw
+
+        return samples
 
     @staticmethod
-    def analyze_risk(tef, vuln, loss, iterations=10000, random_seed=None):
+    def analyze_risk(tef, vuln, loss, iterations=10000, random_seed=None, sample_dtype='float64'):
         """
         Quick FAIR risk analysis using Monte Carlo simulation
 
@@ -82,59 +133,113 @@ class QuickRiskAnalyzer:
             loss: dict with 'low', 'medium', 'high' for Loss Magnitude ($)
             iterations: number of simulation iterations (default: 10000)
             random_seed: optional random seed for reproducibility
+            sample_dtype: 'float64' (default) or 'float32'. With 'float32' the
+                          samples are stored, multiplied and sorted in single
+                          precision; statistics are still accumulated and
+                          reported in float64.
 
         Returns:
             Dictionary with comprehensive risk metrics including:
                 - mean, median: central tendency
                 - p90, var95, cvar95: tail risk metrics
                 - prob_1m, prob_5m: threshold probabilities
-                - samples: full ALE distribution
+                - samples: full ALE distribution, in draw order
         """
-        # Set random seed if provided for reproducibility
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        if sample_dtype not in ('float64', 'float32'):
+            raise ValueError(f"Invalid sample_dtype '{sample_dtype}'. "
+                             f"Must be 'float64' or 'float32'")
 
-        # Run Monte Carlo simulation using PERT distributions
-        tef_samples = QuickRiskAnalyzer.pert_distribution(
-            tef['low'], tef['medium'], tef['high'], iterations
-        )
-        vuln_samples = QuickRiskAnalyzer.pert_distribution(
-            vuln['low'], vuln['medium'], vuln['high'], iterations
-        )
-        loss_samples = QuickRiskAnalyzer.pert_distribution(
-            loss['low'], loss['medium'], loss['high'], iterations
+        # Per-call PCG64 generator, seeded for reproducibility if provided
+        rng = np.random.default_rng(random_seed)
+
+        # Run Monte Carlo simulation using PERT distributions (one row per factor)
+        samples = QuickRiskAnalyzer._pert_samples(
+            [(factor['low'], factor['medium'], factor['high']) for factor in (tef, vuln, loss)],
+            iterations, rng, np.dtype(sample_dtype)
         )
 
         # Calculate Annual Loss Expectancy (FAIR model)
-        # ALE = TEF × Vulnerability × Loss Magnitude
-        ale_samples = tef_samples * vuln_samples * loss_samples
+        # ALE = TEF × Vulnerability × Loss Magnitude - written to its own array
+        # so the returned samples don't keep the whole (3, N) draw alive
+        ale_samples = np.multiply(samples[0], samples[1])
+        ale_samples *= samples[2]
+        del samples
+
+        mean = np.mean(ale_samples, dtype=np.float64)
+        std = np.std(ale_samples, ddof=1, dtype=np.float64)  # Sample std dev
 
-        # Calculate VaR once to avoid redundant computation
-        var95_value = np.percentile(ale_samples, 95)
+        # One sort of a copy serves the order statistics, CVaR and threshold
+        # probabilities; the returned samples (and CSV export) keep draw order
+        (median, p90, var95_value), cvar95_value, (prob_1m, prob_5m) = \
+            QuickRiskAnalyzer._sorted_statistics(np.sort(ale_samples), (50, 90, 95),
+                                                 (1000000, 5000000))
 
         # Calculate comprehensive statistics
         return {
-            'mean': np.mean(ale_samples),
-            'median': np.median(ale_samples),
-            'std': np.std(ale_samples, ddof=1),  # Sample std dev
-            'p90': np.percentile(ale_samples, 90),
+            'mean': mean,
+            'median': median,
+            'std': std,
+            'p90': p90,
             'var95': var95_value,  # Value at Risk (95%)
-            'cvar95': np.mean(ale_samples[ale_samples >= var95_value]),  # Conditional VaR
-            'prob_1m': np.sum(ale_samples > 1000000) / len(ale_samples),
-            'prob_5m': np.sum(ale_samples > 5000000) / len(ale_samples),
+            'cvar95': cvar95_value,  # Conditional VaR
+            'prob_1m': prob_1m,
+            'prob_5m': prob_5m,
             'samples': ale_samples
         }
-    
+
+    @staticmethod
+    def _sorted_statistics(sorted_samples, levels, thresholds=()):
+        """
+        Compute percentiles, the CVaR at the last level and exceedance
+        probabilities from already-sorted samples
+
+        Percentiles use NumPy's default linear interpolation, so they match
+        np.percentile(). The samples at or above the top level's VaR, and
+        those above each threshold, are contiguous runs at the end of the
+        array, located with a binary search.
+
+        Args:
+            sorted_samples: 1-D array of samples in ascending order
+            levels: Increasing percentile levels (0-100); CVaR uses the last
+            thresholds: Values to compute P(sample > threshold) for
+
+        Returns:
+            Tuple of (percentile values array, CVaR at levels[-1],
+            list of exceedance probabilities in threshold order)
+        """
+        n = len(sorted_samples)
+        virtual = (n - 1) * (np.asarray(levels, dtype=float) / 100)
+        lower = np.floor(virtual).astype(np.intp)
+        upper = np.minimum(lower + 1, n - 1)
+        gamma = virtual - lower
+
+        below, above = (sorted_samples[index].astype(np.float64) for index in (lower, upper))
+        diff = above - below
+        values = np.where(gamma >= 0.5, above - diff * (1 - gamma), below + diff * gamma)
+
+        tail_start = np.searchsorted(sorted_samples, values[-1], side='left')
+        exceeding = n - np.searchsorted(sorted_samples, thresholds, side='right')
+        tail_mean = np.mean(sorted_samples[tail_start:], dtype=np.float64)
+        return values, tail_mean, (exceeding / n).tolist()
+
     @staticmethod
     def create_quick_visualization(results, title="Risk Analysis"):
-        """Create a simple 4-panel visualization"""
+        """
+        Create a simple 4-panel visualization
+
+        Args:
+            results: dict from analyze_risk()
+            title: figure title (default: "Risk Analysis")
+        """
+        import matplotlib.pyplot as plt
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
         fig.suptitle(title, fontsize=14, fontweight='bold')
         
         samples = results['samples']
         
-        # 1. Loss Distribution
-        ax1.hist(samples, bins=50, edgecolor='black', alpha=0.7, color='steelblue')
+        # 1. Loss Distribution (binned here, so matplotlib only draws the bars)
+        counts, edges = np.histogram(samples, bins=50)
+        ax1.hist(edges[:-1], edges, weights=counts, edgecolor='black', alpha=0.7, color='steelblue')
         ax1.axvline(results['mean'], color='red', linestyle='--', label=f"Mean: ${results['mean']:,.0f}")
         ax1.axvline(results['p90'], color='orange', linestyle='--', label=f"90th %: ${results['p90']:,.0f}")
         ax1.set_xlabel('Annual Loss ($)')
@@ -193,6 +298,20 @@ def main():
             print("\n⚠️  Continuing despite integrity check failure...")
             print("    (Results may not be trustworthy)\n")
 
+    # Repeated analyses loop here rather than recursing into main()
+    while True:
+        run_interactive_analysis()
+
+        # Ask if user wants to run another analysis
+        again = input("\nRun another analysis? (y/n) [default: n]: ").strip().lower()
+        if again != 'y':
+            break
+        print("\n" + "="*60 + "\n")
+
+
+def run_interactive_analysis():
+    """Prompt for one scenario, analyze it and offer visualization/export"""
+
     print("╔════════════════════════════════════════════════════════════╗")
     print("║              QUICK RISK ANALYSIS TOOL                      ║")
     print("╚════════════════════════════════════════════════════════════╝\n")
@@ -360,6 +479,7 @@ def main():
     # Ask about visualization
     show_viz = input("\n📊 Generate visualization? (y/n) [default: y]: ").strip().lower()
     if show_viz != 'n':
+        import matplotlib.pyplot as plt
         fig = analyzer.create_quick_visualization(results, title=scenario_name)
         plt.show()
         
@@ -373,6 +493,7 @@ def main():
     export = input("\n💾 Export detailed results? (excel/csv/json/none) [default: none]: ").strip().lower()
     
     if export == 'excel':
+        import pandas as pd
         filename = f"risk_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         df = pd.DataFrame({
             'Scenario': [scenario_name],
@@ -388,6 +509,7 @@ def main():
         print(f"✓ Exported to {filename}")
     
     elif export == 'csv':
+        import pandas as pd
         filename = f"risk_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         df = pd.DataFrame({'Annual_Loss': results['samples']})
         df.to_csv(filename, index=False)
@@ -420,12 +542,6 @@ def main():
         print(f"✓ Exported to {filename}")
     
     print("\n✨ Analysis complete! Thank you for using Quick Risk Analysis.")
-    
-    # Ask if user wants to run another analysis
-    again = input("\nRun another analysis? (y/n) [default: n]: ").strip().lower()
-    if again == 'y':
-        print("\n" + "="*60 + "\n")
-        main()
 
 
 if __name__ == "__main__":
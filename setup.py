@@ -63,6 +63,11 @@ setup(
         "": ["scenarios_template.json", "*.md"],
     },
     extras_require={
+        "fast": [
+            "blake3>=0.3.0",
+            "orjson>=3.6.0",
+            "numba>=0.56.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
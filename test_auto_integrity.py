@@ -266,8 +266,8 @@ class TestAutoIntegrity:
                 timeout=30
             )
 
-            # Check that tampering was detected
-            if "TAMPERING DETECTED" in result.stdout or "MODIFIED" in result.stdout:
+            # Check that tampering was detected (the alert is written to stderr)
+            if "TAMPERING DETECTED" in result.stderr:
                 print("✓ Tampering was correctly detected")
                 success = True
             else:
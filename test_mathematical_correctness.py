@@ -94,6 +94,29 @@ def test_pert_distribution_bounds():
                            f"Samples outside [{low}, {high}]: [{min_sample:.2f}, {max_sample:.2f}]")
 
 
+def test_pert_vectorized():
+    """Test that a multi-row PERT draw matches separate per-row draws"""
+    calc = FAIRRiskCalculator(iterations=1000)
+    params = [(1, 3, 6), (0.2, 0.5, 0.85), (5, 5, 5), (5e6, 5e6 + 1e-7, 5e6 + 2e-7)]
+
+    calc.reset_rng(7)
+    separate = [calc._pert_distribution(low, medium, high, 1000)
+                for low, medium, high in params[:2]]
+    calc.reset_rng(7)
+    combined = calc._pert_distribution(*zip(*params), 1000)
+
+    if combined.shape != (4, 1000):
+        results.record_fail("PERT vectorized draw", f"Unexpected shape {combined.shape}")
+    elif not all(np.array_equal(row, expected) for row, expected in zip(combined, separate)):
+        results.record_fail("PERT vectorized draw", "Rows differ from separate draws")
+    elif not np.all(combined[2] == 5):
+        results.record_fail("PERT vectorized draw", "Degenerate row is not constant")
+    elif not np.all(combined[3] == 5e6 + 1e-7):
+        results.record_fail("PERT vectorized draw", "Near-degenerate row is not pinned to the mode")
+    else:
+        results.record_pass("PERT vectorized draw")
+
+
 def test_pert_validation():
     """Test PERT distribution input validation"""
     calc = FAIRRiskCalculator(random_seed=42)
@@ -144,6 +167,30 @@ def test_triangular_distribution():
         results.record_fail("Triangular distribution correctness", "; ".join(reasons))
 
 
+def test_triangular_batch_mode_at_high():
+    """Test that batched triangular draws accept a mode equal to a high low + span rounds below"""
+    calc = FAIRRiskCalculator(iterations=1000, random_seed=52)
+    calc.add_scenario(
+        scenario_id="TRI_ROUND",
+        description="Triangular Rounding Test",
+        tef_low=1, tef_medium=2, tef_high=4,
+        vuln_low=0.10012916450701995, vuln_medium=0.40614798181988804,
+        vuln_high=0.40614798181988804,
+        loss_low=1000, loss_medium=2000, loss_high=5000
+    )
+    try:
+        batch_results = calc.run_simulations_batch(distribution='triangular')
+    except ValueError as e:
+        results.record_fail("Triangular batch mode at high", str(e))
+        return
+
+    vuln_samples = batch_results[0]['vuln_samples']
+    if vuln_samples.max() > 0.40614798181988804:
+        results.record_fail("Triangular batch mode at high", "Samples above high")
+    else:
+        results.record_pass("Triangular batch mode at high")
+
+
 def test_fair_model_calculation():
     """Test FAIR model: ALE = TEF × V × LM"""
     calc = FAIRRiskCalculator(iterations=10000, random_seed=42)
@@ -200,7 +247,7 @@ def test_statistical_metrics():
         stats['percentile_75'], stats['percentile_90'], stats['percentile_95'],
         stats['percentile_99']
     ]
-    ordered = all(percentiles[i] <= percentiles[i+1] for i in range(len(percentiles)-1))
+    ordered = bool(np.all(np.diff(percentiles) >= 0))
     if ordered:
         checks.append(("Percentiles ordered", True, ""))
     else:
@@ -281,25 +328,19 @@ def test_input_validation():
 
 def test_random_seed_reproducibility():
     """Test that random seed produces reproducible results"""
-    calc1 = FAIRRiskCalculator(iterations=10000, random_seed=123)
-    calc1.add_scenario(
+    calc = FAIRRiskCalculator(iterations=10000, random_seed=123)
+    calc.add_scenario(
         scenario_id="SEED_TEST",
         description="Seed Test",
         tef_low=1, tef_medium=5, tef_high=10,
         vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
         loss_low=100000, loss_medium=500000, loss_high=2000000
     )
-    result1 = calc1.run_simulation("SEED_TEST")
+    result1 = calc.run_simulation("SEED_TEST")
 
-    calc2 = FAIRRiskCalculator(iterations=10000, random_seed=123)
-    calc2.add_scenario(
-        scenario_id="SEED_TEST",
-        description="Seed Test",
-        tef_low=1, tef_medium=5, tef_high=10,
-        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
-        loss_low=100000, loss_medium=500000, loss_high=2000000
-    )
-    result2 = calc2.run_simulation("SEED_TEST")
+    # Re-seeding must reproduce the run of a calculator constructed with the seed
+    calc.reset_rng(123)
+    result2 = calc.run_simulation("SEED_TEST")
 
     # Results should be identical
     if result1['statistics']['mean_loss'] == result2['statistics']['mean_loss']:
@@ -309,6 +350,703 @@ def test_random_seed_reproducibility():
                            f"Results differ: {result1['statistics']['mean_loss']} vs {result2['statistics']['mean_loss']}")
 
 
+def test_parallel_matches_sequential():
+    """Test that parallel and sequential multi-scenario runs give identical results"""
+    run_means = []
+    run_samples = []
+    for parallel in (True, False):
+        calc = FAIRRiskCalculator(iterations=10000, random_seed=321)
+        for sid, tef_high in [("PAR_1", 10), ("PAR_2", 20), ("PAR_3", 30)]:
+            calc.add_scenario(
+                scenario_id=sid,
+                description=f"Parallel Test {sid}",
+                tef_low=1, tef_medium=5, tef_high=tef_high,
+                vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+                loss_low=100000, loss_medium=500000, loss_high=2000000
+            )
+        completed = dict(calc.iter_simulations(parallel=parallel, max_workers=2))
+        scenario_ids = ("PAR_1", "PAR_2", "PAR_3")
+        run_means.append([completed[sid]['statistics']['mean_loss'] for sid in scenario_ids])
+        run_samples.append([completed[sid]['ale_samples'] for sid in scenario_ids])
+        if list(calc.simulation_results) != list(scenario_ids):
+            results.record_fail("Parallel matches sequential",
+                                f"Results not stored in scenario order: "
+                                f"{list(calc.simulation_results)}")
+            return
+
+    if not all(np.array_equal(a, b) for a, b in zip(*run_samples)):
+        results.record_fail("Parallel matches sequential", "Sample arrays differ between runs")
+    elif run_means[0] == run_means[1] and len(set(run_means[0])) == 3:
+        results.record_pass("Parallel matches sequential")
+    else:
+        results.record_fail("Parallel matches sequential",
+                            f"Results differ: {run_means[0]} vs {run_means[1]}")
+
+
+def test_simulation_cache():
+    """Test that unchanged scenarios are not re-simulated"""
+    calc = FAIRRiskCalculator(iterations=10000, random_seed=7)
+    calc.add_scenario(
+        scenario_id="CACHE_1",
+        description="Cache Test",
+        tef_low=1, tef_medium=5, tef_high=10,
+        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+        loss_low=100000, loss_medium=500000, loss_high=2000000
+    )
+    first = dict(calc.iter_simulations(parallel=False))["CACHE_1"]
+    second = dict(calc.iter_simulations(parallel=False))["CACHE_1"]
+    triangular = dict(calc.iter_simulations(distribution='triangular', parallel=False))["CACHE_1"]
+    forced = dict(calc.iter_simulations(parallel=False, use_cache=False))["CACHE_1"]
+
+    if second is not first:
+        results.record_fail("Simulation cache", "Unchanged scenario was re-simulated")
+    elif triangular is first or triangular['distribution_type'] != 'triangular':
+        results.record_fail("Simulation cache", "Cache ignored the distribution type")
+    elif forced is first:
+        results.record_fail("Simulation cache", "use_cache=False still returned cached results")
+    else:
+        results.record_pass("Simulation cache")
+
+
+def test_simulation_cache_bounded():
+    """Test that editing a scenario replaces its cache entry instead of adding one"""
+    calc = FAIRRiskCalculator(iterations=1000, random_seed=8)
+    calc.add_scenario(
+        scenario_id="BOUND_1",
+        description="Cache Bound Test",
+        tef_low=1, tef_medium=5, tef_high=10,
+        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+        loss_low=100000, loss_medium=500000, loss_high=2000000
+    )
+    dict(calc.iter_simulations(parallel=False))
+
+    # Edit the scenario twice - each edit re-simulates it under a new key
+    means = []
+    for tef_high in (20, 30):
+        calc.scenarios[0]['tef']['high'] = tef_high
+        run = dict(calc.iter_simulations(parallel=False))
+        means.append(run["BOUND_1"]['statistics']['mean_loss'])
+
+    if len(calc._sim_cache) != 1:
+        results.record_fail("Simulation cache bound",
+                            f"{len(calc._sim_cache)} entries for one scenario")
+    elif not means[0] < means[1]:
+        results.record_fail("Simulation cache bound",
+                            f"Edited scenario was not re-simulated: {means}")
+    else:
+        results.record_pass("Simulation cache bound")
+
+
+def test_summary_cache():
+    """Test that the scenario summary is reused until scenarios or results change"""
+    calc = FAIRRiskCalculator(iterations=10000, random_seed=11)
+    calc.add_scenario(
+        scenario_id="SUM_1",
+        description="Summary Test",
+        tef_low=1, tef_medium=5, tef_high=10,
+        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+        loss_low=100000, loss_medium=500000, loss_high=2000000
+    )
+    first = calc.run_all_scenarios()
+    samples = calc.simulation_results["SUM_1"]['ale_samples']
+    second = calc.run_all_scenarios()
+
+    if calc.simulation_results["SUM_1"]['ale_samples'] is not samples or not first.equals(second):
+        results.record_fail("Summary cache", "Unchanged summary was recomputed")
+        return
+
+    calc.add_scenario(
+        scenario_id="SUM_2",
+        description="Summary Test 2",
+        tef_low=1, tef_medium=2, tef_high=3,
+        vuln_low=0.1, vuln_medium=0.2, vuln_high=0.3,
+        loss_low=1000, loss_medium=5000, loss_high=20000
+    )
+    third = calc.run_all_scenarios()
+
+    if list(third['Scenario ID']) == ["SUM_1", "SUM_2"]:
+        results.record_pass("Summary cache")
+    else:
+        results.record_fail("Summary cache", f"Cache not invalidated: {list(third['Scenario ID'])}")
+
+
+def test_summary_reuses_existing_results():
+    """Test that run_all_scenarios() summarises existing results unless forced"""
+    calc = FAIRRiskCalculator(iterations=5000, random_seed=47)
+    for scenario_id in ("REUSE_1", "REUSE_2"):
+        calc.add_scenario(
+            scenario_id=scenario_id,
+            description=f"Reuse Test {scenario_id}",
+            tef_low=1, tef_medium=3, tef_high=6,
+            vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+            loss_low=100000, loss_medium=500000, loss_high=2000000
+        )
+        calc.run_simulation(scenario_id)
+    samples = calc.simulation_results["REUSE_1"]['ale_samples']
+
+    summary = calc.run_all_scenarios()
+    reused = calc.simulation_results["REUSE_1"]['ale_samples'] is samples
+    calc.run_all_scenarios(distribution='triangular')
+    rerun_other = calc.simulation_results["REUSE_1"]['distribution_type'] == 'triangular'
+    samples = calc.simulation_results["REUSE_1"]['ale_samples']
+    calc.run_all_scenarios(distribution='triangular', force=True)
+    forced = calc.simulation_results["REUSE_1"]['ale_samples'] is not samples
+
+    if not reused or list(summary['Scenario ID']) != ["REUSE_1", "REUSE_2"]:
+        results.record_fail("Summary reuses results", "Existing results were re-simulated")
+    elif not rerun_other:
+        results.record_fail("Summary reuses results",
+                            "Results for another distribution were reused")
+    elif not forced:
+        results.record_fail("Summary reuses results", "force=True did not re-simulate")
+    else:
+        results.record_pass("Summary reuses results")
+
+
+def test_parallel_summary_reuses_results():
+    """Test that run_all_scenarios(parallel=True) reuses already simulated scenarios"""
+    calc = FAIRRiskCalculator(iterations=10000, random_seed=5)
+    for sid, tef_high in [("REUSE_1", 10), ("REUSE_2", 20)]:
+        calc.add_scenario(
+            scenario_id=sid,
+            description=f"Reuse Test {sid}",
+            tef_low=1, tef_medium=5, tef_high=tef_high,
+            vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+            loss_low=100000, loss_medium=500000, loss_high=2000000
+        )
+    simulated = dict(calc.iter_simulations(max_workers=2))
+    summary = calc.run_all_scenarios(parallel=True, max_workers=2)
+
+    expected = [simulated[sid]['statistics']['mean_loss'] for sid in ("REUSE_1", "REUSE_2")]
+    if list(summary['Mean Loss']) != expected:
+        results.record_fail("Parallel summary reuse",
+                            f"Summary {list(summary['Mean Loss'])} does not match "
+                            f"simulated {expected}")
+    elif calc.simulation_results["REUSE_1"] is not simulated["REUSE_1"]:
+        results.record_fail("Parallel summary reuse", "Unchanged scenario was re-simulated")
+    else:
+        results.record_pass("Parallel summary reuse")
+
+
+def test_batch_simulation():
+    """Test that vectorized batch simulation matches per-scenario simulation"""
+    calc = FAIRRiskCalculator(iterations=100000, random_seed=99)
+    calc.add_scenario(
+        scenario_id="BATCH_1",
+        description="Batch Test",
+        tef_low=1, tef_medium=5, tef_high=10,
+        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+        loss_low=100000, loss_medium=500000, loss_high=2000000
+    )
+    calc.add_scenario(
+        scenario_id="BATCH_FIXED",
+        description="Batch Fixed Values",
+        tef_low=2, tef_medium=2, tef_high=2,
+        vuln_low=0.5, vuln_medium=0.5, vuln_high=0.5,
+        loss_low=1000, loss_medium=1000, loss_high=1000
+    )
+
+    batch = calc.run_simulations_batch()
+    single = calc.run_simulation("BATCH_1")
+
+    batch_mean = batch[0]['statistics']['mean_loss']
+    single_mean = single['statistics']['mean_loss']
+    relative_diff = abs(batch_mean - single_mean) / single_mean
+
+    fixed = batch[1]['statistics']
+    if [r['scenario_id'] for r in batch] != ["BATCH_1", "BATCH_FIXED"]:
+        results.record_fail("Batch simulation", "Results not returned in scenario order")
+    elif relative_diff > 0.02:
+        results.record_fail("Batch simulation",
+                            f"Batch mean {batch_mean:.0f} differs from single-run mean "
+                            f"{single_mean:.0f}")
+    elif fixed['mean_loss'] != 1000 or fixed['std_loss'] != 0:
+        results.record_fail("Batch simulation",
+                            f"Identical values should give constant loss, got {fixed['mean_loss']}")
+    else:
+        results.record_pass("Batch simulation")
+
+
+def test_partition_statistics():
+    """Test that single-partition percentiles and CVaR match np.percentile and a tail mask"""
+    from fair_risk_calculator import _partition_statistics
+
+    rng = np.random.default_rng(5)
+    levels = [10, 25, 50, 75, 90, 95, 99]
+    cases = {
+        'continuous': rng.lognormal(10, 1, 10001),
+        'ties': rng.integers(0, 20, 5000).astype(float),  # percentile lands on tied values
+        'constant': np.full(100, 7.0),
+        'single': np.array([3.0]),
+        'float32': rng.random(4000, dtype=np.float32),
+    }
+    for name, samples in cases.items():
+        values, cvar = _partition_statistics(samples, levels, 95)
+        expected = np.percentile(samples.astype(np.float64), levels)
+        expected_cvar = np.mean(samples[samples >= values[5]], dtype=np.float64)
+        if not np.allclose(values, expected, rtol=1e-6):
+            results.record_fail("Partition statistics",
+                                f"{name}: percentiles differ from np.percentile")
+            return
+        if not np.isclose(cvar, expected_cvar, rtol=1e-12):
+            results.record_fail("Partition statistics",
+                                f"{name}: CVaR {cvar} differs from tail mean {expected_cvar}")
+            return
+
+    # Row-wise (batched) statistics match the per-row ones, tied rows included
+    batch = np.stack([cases['continuous'][:5000], cases['ties'], np.full(5000, 2.0)])
+    values, cvar = _partition_statistics(batch, levels, 95)
+    rows = [_partition_statistics(row, levels, 95) for row in batch]
+    if not (np.array_equal(values, [row[0] for row in rows])
+            and np.array_equal(cvar, [row[1] for row in rows])):
+        results.record_fail("Partition statistics", "Batched rows differ from per-row statistics")
+        return
+    results.record_pass("Partition statistics")
+
+
+def test_array_module_backend():
+    """Test the batch path through a non-NumPy array module (CuPy stand-in)"""
+    import types
+    import fair_risk_calculator
+
+    # Forwards everything to NumPy but is not NumPy, so the xp code paths run
+    fake_cupy = types.ModuleType('cupy')
+    fake_cupy.__getattr__ = lambda name: getattr(np, name)
+    fake_cupy.asnumpy = np.asarray
+
+    saved_module = sys.modules.get('cupy')
+    saved_available = fair_risk_calculator.CUPY_AVAILABLE
+    sys.modules['cupy'] = fake_cupy
+    fair_risk_calculator.CUPY_AVAILABLE = True
+    try:
+        calc = FAIRRiskCalculator(iterations=50000, random_seed=99, backend='cupy')
+        calc.GPU_MIN_ITERATIONS = 1000
+        calc.add_scenario(
+            scenario_id="XP_1",
+            description="Array Module Test",
+            tef_low=1, tef_medium=5, tef_high=10,
+            vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+            loss_low=100000, loss_medium=500000, loss_high=2000000
+        )
+        calc.add_scenario(
+            scenario_id="XP_FIXED",
+            description="Array Module Fixed Values",
+            tef_low=2, tef_medium=2, tef_high=2,
+            vuln_low=0.5, vuln_medium=0.5, vuln_high=0.5,
+            loss_low=1000, loss_medium=1000, loss_high=1000
+        )
+        batch = calc.run_simulations_batch()
+    finally:
+        fair_risk_calculator.CUPY_AVAILABLE = saved_available
+        if saved_module is None:
+            sys.modules.pop('cupy', None)
+        else:
+            sys.modules['cupy'] = saved_module
+
+    host = FAIRRiskCalculator(iterations=50000, random_seed=99)
+    host.scenarios = calc.scenarios
+    expected = host.run_simulations_batch()
+
+    stats = batch[0]['statistics']
+    expected_mean = expected[0]['statistics']['mean_loss']
+    ale = batch[0]['ale_samples']
+    if not isinstance(ale, np.ndarray) or not isinstance(stats['percentile_95'], float):
+        results.record_fail("Array module backend", "Results were not copied back to NumPy types")
+    elif set(stats) != set(expected[0]['statistics']):
+        results.record_fail("Array module backend", "Statistics keys differ from the NumPy backend")
+    elif ale.min() < 1 * 0.2 * 100000 or ale.max() > 10 * 0.8 * 2000000:
+        results.record_fail("Array module backend", "ALE samples fell outside the input bounds")
+    elif abs(stats['mean_loss'] - expected_mean) / expected_mean > 0.02:
+        results.record_fail("Array module backend",
+                            f"Mean {stats['mean_loss']:.0f} differs from NumPy backend "
+                            f"{expected_mean:.0f}")
+    elif batch[1]['statistics']['mean_loss'] != 1000 or batch[1]['statistics']['std_loss'] != 0:
+        results.record_fail("Array module backend",
+                            "Identical values should give constant loss")
+    else:
+        results.record_pass("Array module backend")
+
+
+def test_simulate_and_export():
+    """Test that the single-pass export matches the results it simulated"""
+    import json
+    import os
+    import tempfile
+    import pandas as pd
+
+    calc = FAIRRiskCalculator(iterations=2000, random_seed=21)
+    for scenario_id, loss in (("EXPORT_1", 100000), ("EXPORT_2", 250000)):
+        calc.add_scenario(
+            scenario_id=scenario_id,
+            description=f"Export Test {scenario_id}",
+            tef_low=1, tef_medium=3, tef_high=6,
+            vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+            loss_low=loss, loss_medium=loss * 2, loss_high=loss * 4
+        )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        excel_path = os.path.join(tmp_dir, "export.xlsx")
+        json_path = os.path.join(tmp_dir, "export.json")
+        calc.simulate_and_export(excel_filename=excel_path, json_filename=json_path,
+                                 parallel=False)
+
+        summary = pd.read_excel(excel_path, sheet_name="Summary")
+        sim_sheet = pd.read_excel(excel_path, sheet_name="Sim_EXPORT_2")
+        with open(json_path) as f:
+            exported = json.load(f)
+
+    expected_means = [calc.simulation_results[sid]['statistics']['mean_loss']
+                      for sid in ("EXPORT_1", "EXPORT_2")]
+    if list(summary['Scenario ID']) != ["EXPORT_1", "EXPORT_2"]:
+        results.record_fail("Single-pass export", "Summary rows not in scenario order")
+    elif not np.allclose(summary['Mean Loss'], expected_means):
+        results.record_fail("Single-pass export", "Summary does not match simulated results")
+    elif not np.allclose(sim_sheet['Annual Loss'],
+                         calc.simulation_results["EXPORT_2"]['ale_samples']):
+        results.record_fail("Single-pass export", "Sim sheet does not match simulated samples")
+    elif not np.isclose(exported['results']['EXPORT_1']['statistics']['mean_loss'],
+                        expected_means[0]):
+        results.record_fail("Single-pass export", "JSON export does not match simulated results")
+    else:
+        results.record_pass("Single-pass export")
+
+
+def test_render_payload():
+    """Test that render workers are sent the plotting summary, not the samples"""
+    import os
+    import pickle
+    import tempfile
+    from fair_risk_calculator import _render_scenario_figure
+
+    calc = FAIRRiskCalculator(iterations=50000, random_seed=8)
+    calc.add_scenario(
+        scenario_id="RENDER_1",
+        description="Render Payload Test",
+        tef_low=1, tef_medium=3, tef_high=6,
+        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+        loss_low=100000, loss_medium=200000, loss_high=800000
+    )
+    full = calc.run_simulation("RENDER_1")
+    payload = calc._render_payload(full)
+    expected_fliers = calc._sample_summary(full, all_fliers=True)['ale_box']['fliers']
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        save_path = _render_scenario_figure(payload, os.path.join(tmp_dir, "render.png"))
+        rendered = os.path.getsize(save_path) > 0
+
+    if any(key.endswith('_samples') for key in payload):
+        results.record_fail("Render payload", "Sample arrays were left in the payload")
+    elif len(pickle.dumps(payload)) * 10 > len(pickle.dumps(full)):
+        results.record_fail("Render payload", "Payload is not much smaller than the results")
+    elif not np.array_equal(payload['sample_summary']['ale_box']['fliers'], expected_fliers):
+        results.record_fail("Render payload", "Payload does not keep every box plot outlier")
+    elif 'ale_samples' not in full:
+        results.record_fail("Render payload", "Building the payload modified the results")
+    elif not rendered:
+        results.record_fail("Render payload", "Figure was not rendered from the payload")
+    else:
+        results.record_pass("Render payload")
+
+
+def test_excel_export_engines_match():
+    """Test that the xlsxwriter and openpyxl write-only exports hold the same data"""
+    import os
+    import tempfile
+    import pandas as pd
+    import fair_risk_calculator
+
+    calc = FAIRRiskCalculator(iterations=2000, random_seed=23)
+    calc.add_scenario(
+        scenario_id="ENGINE",
+        description="Excel Engine Test",
+        tef_low=1, tef_medium=3, tef_high=6,
+        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+        loss_low=100000, loss_medium=500000, loss_high=2000000
+    )
+    calc.run_simulation("ENGINE")
+    summary_df = calc.run_all_scenarios()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        streaming_path = os.path.join(tmp_dir, "streaming.xlsx")
+        write_only_path = os.path.join(tmp_dir, "write_only.xlsx")
+        calc._write_excel_write_only(write_only_path, summary_df, calc._scenario_definitions())
+        if fair_risk_calculator.XLSXWRITER_AVAILABLE:
+            calc._write_excel_streaming(streaming_path, summary_df, calc._scenario_definitions())
+            streaming = pd.read_excel(streaming_path, sheet_name=None)
+        write_only = pd.read_excel(write_only_path, sheet_name=None)
+
+    if list(write_only) != ["Summary", "Sim_ENGINE", "Scenarios"]:
+        results.record_fail("Excel export engines", f"Unexpected sheets: {list(write_only)}")
+    elif not np.allclose(write_only["Sim_ENGINE"]["Annual Loss"],
+                         calc.simulation_results["ENGINE"]["ale_samples"]):
+        results.record_fail("Excel export engines", "Write-only Sim sheet does not match samples")
+    elif fair_risk_calculator.XLSXWRITER_AVAILABLE and any(
+            not streaming[name].equals(write_only[name]) for name in streaming):
+        results.record_fail("Excel export engines", "xlsxwriter and openpyxl exports differ")
+    else:
+        results.record_pass("Excel export engines")
+
+
+def test_excel_export_keeps_distribution():
+    """Test that export_to_excel() exports triangular results without re-simulating them"""
+    import os
+    import tempfile
+    import pandas as pd
+
+    calc = FAIRRiskCalculator(iterations=2000, random_seed=24)
+    calc.add_scenario(
+        scenario_id="TRI_EXPORT",
+        description="Triangular Export Test",
+        tef_low=1, tef_medium=3, tef_high=6,
+        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+        loss_low=100000, loss_medium=500000, loss_high=2000000
+    )
+    calc.run_simulation("TRI_EXPORT", distribution='triangular')
+    samples = calc.simulation_results["TRI_EXPORT"]['ale_samples']
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "triangular.xlsx")
+        calc.export_to_excel(path)
+        exported = pd.read_excel(path, sheet_name="Sim_TRI_EXPORT")
+
+    if calc.simulation_results["TRI_EXPORT"]['ale_samples'] is not samples:
+        results.record_fail("Excel export keeps distribution",
+                            "Triangular results were re-simulated")
+    elif not np.allclose(exported["Annual Loss"], samples):
+        results.record_fail("Excel export keeps distribution",
+                            "Sim sheet does not match the samples")
+    else:
+        results.record_pass("Excel export keeps distribution")
+
+
+def test_fast_summary_matches_simulation():
+    """Test that the analytic summary agrees with a large Monte Carlo run"""
+    calc = FAIRRiskCalculator(iterations=200000, random_seed=29)
+    calc.add_scenario(
+        scenario_id="FAST",
+        description="Analytic Summary Test",
+        tef_low=1, tef_medium=3, tef_high=6,
+        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.85,
+        loss_low=500000, loss_medium=2080000, loss_high=3500000
+    )
+
+    fast = calc.run_all_scenarios(fast=True)
+    if calc.simulation_results:
+        results.record_fail("Fast summary", "fast=True should not run simulations")
+        return
+    simulated = calc.run_all_scenarios()
+
+    mean_error = abs(fast['Mean Loss'][0] / simulated['Mean Loss'][0] - 1)
+    std_error = abs(fast['Std Dev'][0] / simulated['Std Dev'][0] - 1)
+    median_error = abs(fast['Median Loss'][0] / simulated['Median Loss'][0] - 1)
+    if list(fast.columns) != list(simulated.columns):
+        results.record_fail("Fast summary", "Columns differ from the simulated summary")
+    elif mean_error > 0.01 or std_error > 0.01:
+        results.record_fail("Fast summary",
+                            f"Mean/std off by {mean_error:.2%}/{std_error:.2%} (expected < 1%)")
+    elif median_error > 0.05:
+        results.record_fail("Fast summary", f"Median off by {median_error:.2%} (expected < 5%)")
+    else:
+        results.record_pass("Fast summary")
+
+
+def test_store_samples_disabled():
+    """Test that store_samples=False keeps statistics but drops raw samples"""
+    from matplotlib.figure import Figure
+
+    stats = []
+    for store_samples in (True, False):
+        calc = FAIRRiskCalculator(iterations=10000, random_seed=17, store_samples=store_samples)
+        calc.add_scenario(
+            scenario_id="COMPACT",
+            description="Compact Results Test",
+            tef_low=1, tef_medium=3, tef_high=6,
+            vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+            loss_low=100000, loss_medium=500000, loss_high=2000000
+        )
+        result = calc.run_simulation("COMPACT")
+        stats.append(result['statistics'])
+
+    if any(key.endswith('_samples') for key in result):
+        results.record_fail("Compact results", f"Sample arrays still stored: {sorted(result)}")
+    elif stats[0] != stats[1]:
+        results.record_fail("Compact results", "Statistics differ when samples are dropped")
+    else:
+        try:
+            calc.create_visualizations("COMPACT", fig=Figure(figsize=(16, 10)))
+            results.record_pass("Compact results")
+        except Exception as e:
+            results.record_fail("Compact results", f"Visualization failed without samples: {e}")
+
+
+def test_plot_point_count_bounded():
+    """Test that the analysis figure plots pre-binned, downsampled data"""
+    from matplotlib.figure import Figure
+
+    calc = FAIRRiskCalculator(iterations=200000, random_seed=31)
+    calc.add_scenario(
+        scenario_id="PLOT",
+        description="Plot Size Test",
+        tef_low=1, tef_medium=3, tef_high=6,
+        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+        loss_low=100000, loss_medium=500000, loss_high=2000000
+    )
+    calc.run_simulation("PLOT")
+    fig = Figure(figsize=(16, 10))
+    calc.create_visualizations("PLOT", fig=fig)
+
+    hist_ax, cdf_ax = fig.axes[0], fig.axes[1]
+    cdf_points = len(cdf_ax.lines[0].get_xdata())
+    limit = 2 * FAIRRiskCalculator.PLOT_QUANTILE_POINTS + 1
+    if len(hist_ax.patches) != FAIRRiskCalculator.PLOT_HISTOGRAM_BINS['ale_samples']:
+        results.record_fail("Bounded plot size", f"Histogram has {len(hist_ax.patches)} bars")
+    elif cdf_points > limit:
+        results.record_fail("Bounded plot size", f"CDF plots {cdf_points} points (limit {limit})")
+    else:
+        results.record_pass("Bounded plot size")
+
+
+def test_float32_samples():
+    """Test that float32 sample storage keeps float64-accurate statistics"""
+    runs = []
+    for sample_dtype in ('float64', 'float32'):
+        calc = FAIRRiskCalculator(iterations=20000, random_seed=37, sample_dtype=sample_dtype)
+        calc.add_scenario(
+            scenario_id="FP32",
+            description="Float32 Samples Test",
+            tef_low=1, tef_medium=3, tef_high=6,
+            vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+            loss_low=100000, loss_medium=500000, loss_high=2000000
+        )
+        runs.append(calc.run_simulations_batch()[0])
+
+    stats64, stats32 = runs[0]['statistics'], runs[1]['statistics']
+    worst = max(abs(stats32[key] - stats64[key]) / max(abs(stats64[key]), 1.0) for key in stats64)
+    if runs[1]['ale_samples'].dtype != np.float32:
+        results.record_fail("Float32 samples", f"Samples stored as {runs[1]['ale_samples'].dtype}")
+    elif any(type(value) is not np.float64 for value in stats32.values()):
+        results.record_fail("Float32 samples", "Statistics are not reported as float64")
+    elif worst > 1e-5:
+        results.record_fail("Float32 samples", f"Statistics differ by up to {worst:.2e} (relative)")
+    else:
+        results.record_pass("Float32 samples")
+
+
+def test_output_buffer_reuse():
+    """Test that runs without stored samples share LEF/ALE buffers safely"""
+    calc = FAIRRiskCalculator(iterations=5000, random_seed=41, store_samples=False)
+    for scenario_id, loss in (("BUF_1", 100000), ("BUF_2", 900000)):
+        calc.add_scenario(
+            scenario_id=scenario_id,
+            description=f"Buffer Test {scenario_id}",
+            tef_low=1, tef_medium=3, tef_high=6,
+            vuln_low=0.2, vuln_medium=0.5, vuln_high=0.8,
+            loss_low=loss, loss_medium=loss * 2, loss_high=loss * 4
+        )
+
+    first = calc.run_simulation("BUF_1")
+    first_cdf = first['sample_summary']['ale_cdf'][0].copy()
+    buffers = calc._lef_ale_buffers
+    calc.run_simulation("BUF_2")
+
+    if buffers is None or calc._lef_ale_buffers[1] is not buffers[1]:
+        results.record_fail("Output buffer reuse", "LEF/ALE buffers were not reused")
+    elif not np.array_equal(first['sample_summary']['ale_cdf'][0], first_cdf):
+        results.record_fail("Output buffer reuse", "Earlier result changed by a later run")
+    elif FAIRRiskCalculator(iterations=5000)._output_buffers((5000,)) is not None:
+        results.record_fail("Output buffer reuse", "Buffers handed out while samples are stored")
+    else:
+        results.record_pass("Output buffer reuse")
+
+
+def test_quick_analyzer_sampling():
+    """Test that the quick analyzer's fused draw matches separate PERT draws, in draw order"""
+    from quick_risk_analysis import QuickRiskAnalyzer
+
+    tef = {'low': 1, 'medium': 3, 'high': 6}
+    vuln = {'low': 0.5, 'medium': 0.5, 'high': 0.5}  # Degenerate row
+    loss = {'low': 100000, 'medium': 500000, 'high': 2000000}
+    fused = QuickRiskAnalyzer.analyze_risk(tef, vuln, loss, iterations=2000, random_seed=48)
+
+    rng = np.random.default_rng(48)
+    separate = np.prod([QuickRiskAnalyzer.pert_distribution(f['low'], f['medium'], f['high'],
+                                                            2000, rng=rng)
+                        for f in (tef, vuln, loss)], axis=0)
+
+    if not np.array_equal(fused['samples'], separate):
+        results.record_fail("Quick analyzer sampling", "Fused draw differs from separate draws")
+    else:
+        results.record_pass("Quick analyzer sampling")
+
+
+def test_quick_analyzer_sorted_statistics():
+    """Test that the sorted-sample percentiles, CVaR and exceedances match the direct calculation"""
+    from quick_risk_analysis import QuickRiskAnalyzer
+
+    rng = np.random.default_rng(49)
+    mismatched = []
+    for size in (1, 2, 999, 1000):
+        samples = rng.lognormal(size=size)
+        samples[:size // 3] = samples[0]  # Ties
+        thresholds = (0.5, 2.0, samples.max())
+        values, cvar, probabilities = QuickRiskAnalyzer._sorted_statistics(
+            np.sort(samples), (50, 90, 95), thresholds)
+        expected = np.percentile(samples, [50, 90, 95])
+        if not np.array_equal(values, expected) or \
+                not np.isclose(cvar, np.mean(samples[samples >= expected[2]]), rtol=1e-12) or \
+                probabilities != [np.mean(samples > threshold) for threshold in thresholds]:
+            mismatched.append(size)
+
+    if mismatched:
+        results.record_fail("Quick analyzer sorted statistics", f"Mismatch for sizes {mismatched}")
+    else:
+        results.record_pass("Quick analyzer sorted statistics")
+
+
+def test_quick_analyzer_float32():
+    """Test that float32 quick-analysis samples give float64 statistics close to the default"""
+    from quick_risk_analysis import QuickRiskAnalyzer
+
+    tef = {'low': 1, 'medium': 3, 'high': 6}
+    vuln = {'low': 0.2, 'medium': 0.5, 'high': 0.85}
+    loss = {'low': 500000, 'medium': 2000000, 'high': 3500000}
+    double = QuickRiskAnalyzer.analyze_risk(tef, vuln, loss, iterations=20000, random_seed=50)
+    single = QuickRiskAnalyzer.analyze_risk(tef, vuln, loss, iterations=20000, random_seed=50,
+                                            sample_dtype='float32')
+
+    drifted = [key for key in ('mean', 'median', 'std', 'p90', 'var95', 'cvar95')
+               if not np.isclose(single[key], double[key], rtol=1e-6)]
+    if single['samples'].dtype != np.float32 or not isinstance(single['mean'], np.float64):
+        results.record_fail("Quick analyzer float32", "Samples or statistics have the wrong dtype")
+    elif drifted:
+        results.record_fail("Quick analyzer float32", f"Statistics drifted: {drifted}")
+    else:
+        results.record_pass("Quick analyzer float32")
+
+
+def test_quick_analyzer_endpoint_mode():
+    """Test that PERT samples with the mode at an end point follow the Beta(1, 5) shape"""
+    from quick_risk_analysis import QuickRiskAnalyzer
+
+    rng = np.random.default_rng(51)
+    failures = []
+    for low, medium, high in ((2, 2, 10), (2, 10, 10)):
+        samples = QuickRiskAnalyzer.pert_distribution(low, medium, high, 200000, rng=rng)
+        alpha = 1 + 4 * (medium - low) / (high - low)
+        beta = 1 + 4 * (high - medium) / (high - low)
+        reference = low + (high - low) * rng.beta(alpha, beta, 200000)
+        if samples.min() < low or samples.max() > high:
+            failures.append(f"({low}, {medium}, {high}) out of bounds")
+        elif not np.allclose(np.percentile(samples, [10, 50, 90]),
+                             np.percentile(reference, [10, 50, 90]), rtol=0.01):
+            failures.append(f"({low}, {medium}, {high}) percentiles differ")
+
+    if failures:
+        results.record_fail("Quick analyzer end-point mode", "; ".join(failures))
+    else:
+        results.record_pass("Quick analyzer end-point mode")
+
+
 def test_edge_case_zero_vulnerability():
     """Test edge case: zero vulnerability means zero loss"""
     calc = FAIRRiskCalculator(iterations=1000, random_seed=42)
@@ -427,12 +1165,36 @@ if __name__ == "__main__":
     tests = [
         ("PERT Distribution Mean", test_pert_distribution_mean),
         ("PERT Distribution Bounds", test_pert_distribution_bounds),
+        ("PERT Vectorized Draw", test_pert_vectorized),
         ("PERT Validation", test_pert_validation),
         ("Triangular Distribution", test_triangular_distribution),
+        ("Triangular Batch Mode at High", test_triangular_batch_mode_at_high),
         ("FAIR Model Calculation", test_fair_model_calculation),
         ("Statistical Metrics", test_statistical_metrics),
         ("Input Validation", test_input_validation),
         ("Random Seed Reproducibility", test_random_seed_reproducibility),
+        ("Parallel Matches Sequential", test_parallel_matches_sequential),
+        ("Simulation Cache", test_simulation_cache),
+        ("Simulation Cache Bound", test_simulation_cache_bounded),
+        ("Summary Cache", test_summary_cache),
+        ("Parallel Summary Reuse", test_parallel_summary_reuses_results),
+        ("Batch Simulation", test_batch_simulation),
+        ("Partition Statistics", test_partition_statistics),
+        ("Array Module Backend", test_array_module_backend),
+        ("Single-pass Export", test_simulate_and_export),
+        ("Render Payload", test_render_payload),
+        ("Excel Export Engines", test_excel_export_engines_match),
+        ("Excel Export Keeps Distribution", test_excel_export_keeps_distribution),
+        ("Fast Summary", test_fast_summary_matches_simulation),
+        ("Bounded Plot Size", test_plot_point_count_bounded),
+        ("Float32 Samples", test_float32_samples),
+        ("Output Buffer Reuse", test_output_buffer_reuse),
+        ("Quick Analyzer Sampling", test_quick_analyzer_sampling),
+        ("Quick Analyzer Sorted Statistics", test_quick_analyzer_sorted_statistics),
+        ("Quick Analyzer Float32", test_quick_analyzer_float32),
+        ("Quick Analyzer End-point Mode", test_quick_analyzer_endpoint_mode),
+        ("Summary Reuses Results", test_summary_reuses_existing_results),
+        ("Compact Results", test_store_samples_disabled),
         ("Edge Case: Zero Vulnerability", test_edge_case_zero_vulnerability),
         ("Edge Case: Identical Values", test_edge_case_identical_values),
         ("Distribution Type Validation", test_distribution_type_validation),
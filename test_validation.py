@@ -196,6 +196,37 @@ def test_edge_case_equal_values():
         return False
 
 
+def test_bulk_scenarios():
+    """Test that add_scenarios() validates the whole batch before adding any of it"""
+    print("Test 8: Bulk scenarios (one invalid, none should be added)...")
+    calc = FAIRRiskCalculator()
+    valid = dict(
+        description="Bulk Test Scenario",
+        tef_low=1.0, tef_medium=3.0, tef_high=6.0,
+        vuln_low=0.2, vuln_medium=0.5, vuln_high=0.85,
+        loss_low=500000, loss_medium=2080000, loss_high=3500000
+    )
+    batch = [dict(valid, scenario_id=f"BULK{i}") for i in range(5)]
+    batch[3]['vuln_high'] = 1.2  # Outside 0-1 - INVALID
+
+    try:
+        calc.add_scenarios(batch)
+        print("✗ FAILED: Invalid batch was accepted\n")
+        return False
+    except ValueError as e:
+        if "'BULK3'" not in str(e) or "between 0 and 1" not in str(e) or calc.scenarios:
+            print(f"✗ FAILED: Wrong error or partial batch added: {e}\n")
+            return False
+
+    batch[3]['vuln_high'] = 0.85
+    calc.add_scenarios(batch)
+    if [scenario['id'] for scenario in calc.scenarios] != [f"BULK{i}" for i in range(5)]:
+        print("✗ FAILED: Valid batch was not added in order\n")
+        return False
+    print("✓ PASSED: Invalid batch rejected atomically, valid batch added\n")
+    return True
+
+
 if __name__ == "__main__":
     print("="*70)
     print("FAIR RISK CALCULATOR - INPUT VALIDATION TESTS")
@@ -209,7 +240,8 @@ if __name__ == "__main__":
         test_invalid_vulnerability,
         test_negative_values,
         test_vulnerability_out_of_range,
-        test_edge_case_equal_values
+        test_edge_case_equal_values,
+        test_bulk_scenarios
     ]
 
     results = [test() for test in tests]
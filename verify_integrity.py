@@ -3,7 +3,8 @@
 FAIR Risk Calculator - Integrity Verification Tool
 
 This script verifies the integrity of critical files by comparing their current
-SHA-256 hashes against the baseline stored in integrity_manifest.json.
+hashes (SHA-256 or BLAKE3, as recorded in the manifest) against the baseline
+stored in integrity_manifest.json.
 
 Usage:
     python verify_integrity.py [--verbose] [--strict]
@@ -18,13 +19,21 @@ Exit Codes:
     2: Manifest file missing or invalid
 """
 
-import hashlib
 import json
 import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Tuple
 
+from integrity_checker import hash_file, new_hasher
+
+# Progress bars are optional - shown on an interactive stderr when tqdm is installed
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
 
 class IntegrityVerifier:
     """Verifies code integrity against baseline manifest"""
@@ -40,6 +49,7 @@ class IntegrityVerifier:
         self.manifest_file = os.path.join(base_dir, manifest_file)
         self.base_dir = base_dir
         self.manifest = None
+        self.algorithm = 'SHA-256'
         self.verification_results = {
             'verified': [],
             'modified': [],
@@ -63,6 +73,8 @@ class IntegrityVerifier:
         try:
             with open(self.manifest_file, 'r') as f:
                 self.manifest = json.load(f)
+            self.algorithm = self.manifest.get('algorithm', 'SHA-256')
+            new_hasher(self.algorithm)  # Fail early on unsupported algorithms
             return True
         except json.JSONDecodeError as e:
             print(f"❌ ERROR: Invalid manifest file format: {e}")
@@ -73,21 +85,16 @@ class IntegrityVerifier:
 
     def calculate_file_hash(self, file_path: str) -> str:
         """
-        Calculate SHA-256 hash of a file
+        Calculate the hash of a file using the manifest's algorithm
 
         Args:
             file_path: Path to the file
 
         Returns:
-            Hexadecimal SHA-256 hash string
+            Hexadecimal hash string
         """
-        sha256_hash = hashlib.sha256()
-
         try:
-            with open(file_path, 'rb') as f:
-                for byte_block in iter(lambda: f.read(4096), b''):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+            return hash_file(file_path, self.algorithm)
         except FileNotFoundError:
             return None
         except Exception as e:
@@ -98,6 +105,9 @@ class IntegrityVerifier:
         """
         Verify a single file against its expected hash
 
+        A file whose size differs from the size recorded in the manifest is
+        reported as modified without being hashed.
+
         Args:
             file_path: Path to the file
             expected_info: Expected file information from manifest
@@ -107,12 +117,24 @@ class IntegrityVerifier:
         """
         full_path = os.path.join(self.base_dir, file_path)
 
-        # Check if file exists
-        if not os.path.exists(full_path):
+        # Check if file exists (the same stat provides the reported size)
+        try:
+            file_size = os.stat(full_path).st_size
+        except FileNotFoundError:
             if expected_info['status'] == 'missing':
                 return 'verified', {'note': 'File was already missing in baseline'}
             return 'missing', {'expected': expected_info['hash'], 'current': None}
 
+        # A different size can only mean different contents - no need to hash
+        expected_size = expected_info.get('size')
+        if expected_size is not None and file_size != expected_size:
+            return 'modified', {
+                'expected': expected_info.get('hash'),
+                'current': None,
+                'size': file_size,
+                'expected_size': expected_size
+            }
+
         # Calculate current hash
         current_hash = self.calculate_file_hash(full_path)
         if current_hash is None:
@@ -123,19 +145,24 @@ class IntegrityVerifier:
         if current_hash == expected_hash:
             return 'verified', {
                 'hash': current_hash,
-                'size': os.path.getsize(full_path)
+                'size': file_size
             }
         else:
             return 'modified', {
                 'expected': expected_hash,
                 'current': current_hash,
-                'size': os.path.getsize(full_path)
+                'size': file_size
             }
 
     def verify_all(self, verbose: bool = False) -> bool:
         """
         Verify all files in the manifest
 
+        hashlib releases the GIL while hashing, so the files are verified in a
+        thread pool; results are still reported in manifest order, written to
+        stdout in one call once every file has been checked. With tqdm
+        installed, a progress bar is shown on an interactive stderr meanwhile.
+
         Args:
             verbose: Show detailed information for all files
 
@@ -155,32 +182,58 @@ class IntegrityVerifier:
         print(f"Files to verify: {len(self.manifest['files'])}")
         print("="*70)
 
-        # Verify each file
-        for file_path, expected_info in sorted(self.manifest['files'].items()):
-            status, details = self.verify_file(file_path, expected_info)
+        # Verify every file, then report them in order
+        entries = sorted(self.manifest['files'].items())
+        workers = min(8, os.cpu_count() or 1, len(entries))
+        executor = None
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            outcomes = (executor.map if executor else map)(
+                lambda entry: self.verify_file(*entry), entries)
+            if TQDM_AVAILABLE and sys.stderr.isatty():
+                outcomes = tqdm(outcomes, total=len(entries), desc="Verifying", unit="file",
+                                leave=False)
+            outcomes = list(outcomes)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        lines = []
+        for (file_path, _), (status, details) in zip(entries, outcomes):
 
             # Categorize results
             if status == 'verified':
                 self.verification_results['verified'].append(file_path)
                 if verbose:
-                    print(f"✅ VERIFIED: {file_path}")
+                    lines.append(f"✅ VERIFIED: {file_path}")
             elif status == 'modified':
                 self.verification_results['modified'].append({
                     'file': file_path,
                     'details': details
                 })
-                print(f"⚠️  MODIFIED: {file_path}")
-                print(f"   Expected: {details['expected']}")
-                print(f"   Current:  {details['current']}")
+                lines.append(f"⚠️  MODIFIED: {file_path}")
+                lines.append(f"   Expected: {details['expected']}")
+                if details['current'] is None:
+                    lines.append(f"   Size changed: {details['expected_size']:,} -> "
+                                 f"{details['size']:,} bytes (not hashed)")
+                else:
+                    lines.append(f"   Current:  {details['current']}")
             elif status == 'missing':
                 self.verification_results['missing'].append(file_path)
-                print(f"❌ MISSING: {file_path}")
+                lines.append(f"❌ MISSING: {file_path}")
             elif status == 'error':
                 self.verification_results['errors'].append({
                     'file': file_path,
                     'details': details
                 })
-                print(f"⚠️  ERROR: {file_path} - {details.get('message', 'Unknown error')}")
+                lines.append(f"⚠️  ERROR: {file_path} - {details.get('message', 'Unknown error')}")
+
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
 
         # Check for tampering
         tampering_detected = (